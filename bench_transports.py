@@ -0,0 +1,96 @@
+"""
+Benchmark XML-RPC vs JSON-RPC decoding for large search_read results
+
+Builds synthetic res.partner-like rows, encodes them the way Odoo answers on
+/xmlrpc/2/object and /jsonrpc, then measures wire bytes (raw and gzip) and the
+client-side decode time of each transport.
+
+Usage:
+    python bench_transports.py                # 10k and 100k rows
+    python bench_transports.py 5000 50000     # custom row counts
+"""
+import gzip
+import json
+import sys
+import time
+import xmlrpc.client
+
+from odoo_mcp_server import decode_jsonrpc_response, _json_loads
+
+
+def make_rows(count):
+    rows = []
+    for i in range(1, count + 1):
+        rows.append({
+            'id': i,
+            'name': f'Partner {i}',
+            'display_name': f'Company {i % 97}, Partner {i}',
+            'email': f'partner{i}@example.com' if i % 4 else False,
+            'phone': f'+62 21 {i:07d}',
+            'is_company': i % 5 == 0,
+            'customer_rank': i % 13,
+            'credit': round(i * 1.37, 2),
+            'country_id': [100, 'Indonesia'] if i % 3 else False,
+            'user_id': [2, 'Administrator'],
+            'category_id': [1, 4, 7][:i % 4],
+            'write_date': f'2025-03-{1 + i % 28:02d} 10:{i % 60:02d}:00',
+        })
+    return rows
+
+
+def xmlrpc_body(rows):
+    return xmlrpc.client.dumps((rows,), methodresponse=True, allow_none=True).encode('utf-8')
+
+
+def jsonrpc_body(rows):
+    return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': rows}).encode('utf-8')
+
+
+def decode_xmlrpc(body):
+    # Same parser/unmarshaller pair ServerProxy uses for every response
+    parser, unmarshaller = xmlrpc.client.getparser()
+    parser.feed(body)
+    parser.close()
+    return unmarshaller.close()[0]
+
+
+def best_of(fn, arg, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(count):
+    rows = make_rows(count)
+    xml = xmlrpc_body(rows)
+    js = jsonrpc_body(rows)
+    xml_gz = gzip.compress(xml, 6)
+    js_gz = gzip.compress(js, 6)
+
+    assert decode_xmlrpc(xml) == decode_jsonrpc_response(js)
+
+    results = [
+        ('xmlrpc', len(xml), len(xml_gz), best_of(decode_xmlrpc, xml),
+         best_of(lambda body: decode_xmlrpc(gzip.decompress(body)), xml_gz)),
+        ('jsonrpc', len(js), len(js_gz), best_of(decode_jsonrpc_response, js),
+         best_of(lambda body: decode_jsonrpc_response(body, 'gzip'), js_gz)),
+    ]
+
+    print(f"## {count:,} rows\n")
+    print("| Transport | Wire bytes | Wire bytes (gzip) | Decode ms | Decode ms (gzip) |")
+    print("| --------- | ---------- | ----------------- | --------- | ---------------- |")
+    for name, raw, packed, decode, decode_gz in results:
+        print(f"| {name} | {raw:,} | {packed:,} | {decode * 1000:.1f} | {decode_gz * 1000:.1f} |")
+    xml_decode, js_decode = results[0][3], results[1][3]
+    print(f"\nJSON-RPC decodes {xml_decode / js_decode:.1f}x faster, "
+          f"gzip cuts JSON wire bytes by {100 - 100 * len(js_gz) / len(js):.0f}%\n")
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    print(f"# Transport benchmark (JSON decoder: {_json_loads.__module__})\n")
+    for count in counts:
+        run(count)
@@ -1,10 +1,33 @@
 import xmlrpc.client
+import argparse
+import collections
+import csv
+import dataclasses
+import difflib
+import functools
+import gzip
+import hashlib
+import hmac
+import http.client
+import itertools
+import json
+import os
+import queue
+import random
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
 from dataclasses import dataclass
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from collections.abc import AsyncIterator
 
+import anyio
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.transport_security import TransportSecuritySettings
 # Tambahkan setelah import yang sudah ada (setelah baris "from mcp.server.fastmcp import FastMCP, Context")
 import base64
 from io import BytesIO
@@ -20,6 +43,212 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Method yang aman untuk diulang (tidak mengubah data di Odoo)
+READ_ONLY_METHODS = frozenset({
+    'search', 'search_read', 'search_count', 'read', 'read_group',
+    'fields_get', 'name_get', 'name_search', 'default_get',
+    'check_access_rights', 'get_views', 'fields_view_get',
+})
+
+# Kode HTTP dari reverse proxy / worker Odoo yang bersifat sementara
+TRANSIENT_HTTP_CODES = frozenset({429, 502, 503, 504})
+
+
+class OdooError(Exception):
+    """Base error raised by the Odoo connection layer"""
+
+
+class OdooUnavailableError(OdooError):
+    """Raised without contacting Odoo while the circuit breaker is open"""
+
+
+class OdooOverloadedError(OdooError):
+    """Raised by the admission scheduler when a call is shed instead of queued (backpressure)"""
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _data_dir(*parts: str) -> str:
+    """Per-user state directory (~/.odoo_mcp), never a path other local users can pre-create"""
+    return os.path.join(os.path.expanduser('~'), '.odoo_mcp', *parts)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """True for network/gateway failures where Odoo never produced an answer"""
+    if isinstance(error, xmlrpc.client.ProtocolError):
+        return error.errcode in TRANSIENT_HTTP_CODES
+    # SSL, DNS dan OSError lain bersifat permanen, jangan diulang
+    return isinstance(error, (socket.timeout, ConnectionError, TimeoutError,
+                              http.client.RemoteDisconnected))
+
+
+def _is_access_error(error: Exception) -> bool:
+    """True when Odoo rejected our credentials or the session expired"""
+    if not isinstance(error, xmlrpc.client.Fault):
+        return False
+    message = str(error.faultString)
+    return any(marker in message for marker in
+               ('AccessDenied', 'Access Denied', 'Session expired', 'SessionExpiredException'))
+
+
+class _TimeoutTransportMixin:
+    timeout: Optional[float] = None
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+        return connection
+
+
+class TimeoutTransport(_TimeoutTransportMixin, xmlrpc.client.Transport):
+    """XML-RPC transport with a socket timeout"""
+
+    def __init__(self, timeout: Optional[float] = None):
+        super().__init__()
+        self.timeout = timeout
+
+
+class SafeTimeoutTransport(_TimeoutTransportMixin, xmlrpc.client.SafeTransport):
+    """XML-RPC over HTTPS with a socket timeout"""
+
+    def __init__(self, timeout: Optional[float] = None):
+        super().__init__()
+        self.timeout = timeout
+
+
+def _server_proxy(url: str, timeout: Optional[float]) -> xmlrpc.client.ServerProxy:
+    transport_cls = SafeTimeoutTransport if url.startswith('https') else TimeoutTransport
+    return xmlrpc.client.ServerProxy(url, transport=transport_cls(timeout), allow_none=True)
+
+
+@dataclass
+class RetryPolicy:
+    """Timeout and retry settings for calls to Odoo (env: ODOO_TIMEOUT, ODOO_MAX_RETRIES, ...)"""
+    timeout: float = 120.0
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+
+    @classmethod
+    def from_env(cls) -> 'RetryPolicy':
+        return cls(
+            timeout=_env_float('ODOO_TIMEOUT', cls.timeout),
+            max_retries=_env_int('ODOO_MAX_RETRIES', cls.max_retries),
+            backoff_base=_env_float('ODOO_RETRY_BACKOFF', cls.backoff_base),
+            backoff_max=_env_float('ODOO_RETRY_BACKOFF_MAX', cls.backoff_max),
+        )
+
+    def delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff so retries from many callers do not line up"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Fail fast while Odoo is unhealthy
+
+    After `failure_threshold` consecutive transient failures the breaker opens and
+    every call is rejected immediately for `reset_timeout` seconds. Then a single
+    probe call is let through (half-open); its outcome closes or re-opens the breaker.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.total_failures = 0
+        self.total_rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'CircuitBreaker':
+        return cls(
+            failure_threshold=_env_int('ODOO_BREAKER_THRESHOLD', 5),
+            reset_timeout=_env_float('ODOO_BREAKER_RESET', 30.0),
+        )
+
+    def before_call(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.total_rejected += 1
+                    raise OdooUnavailableError(
+                        f"Odoo is unavailable (circuit breaker open, retry in "
+                        f"{self.reset_timeout - (time.monotonic() - self.opened_at):.0f}s)")
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self.total_rejected += 1
+                    raise OdooUnavailableError("Odoo is unavailable (circuit breaker probing)")
+                self._probe_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'failure_threshold': self.failure_threshold,
+                'reset_timeout': self.reset_timeout,
+                'retry_in': round(retry_in, 1),
+                'total_failures': self.total_failures,
+                'total_rejected': self.total_rejected,
+            }
+
+
 @dataclass
 class OdooConnection:
     url: str
@@ -29,64 +258,1461 @@ class OdooConnection:
     uid: int = 0
     models: xmlrpc.client.ServerProxy = None
     common: xmlrpc.client.ServerProxy = None
+    retry: RetryPolicy = dataclasses.field(default_factory=RetryPolicy.from_env)
+    breaker: CircuitBreaker = dataclasses.field(default_factory=CircuitBreaker.from_env)
+
+    def connect(self):
+        """Establish connection to Odoo"""
+        self.common = _server_proxy(f'{self.url}/xmlrpc/2/common', self.retry.timeout)
+        self.uid = self.common.authenticate(self.db, self.username, self.password, {})
+        if not self.uid:
+            raise OdooError("Failed to authenticate with Odoo")
+        self.models = _server_proxy(f'{self.url}/xmlrpc/2/object', self.retry.timeout)
+        return self
+
+    def version(self) -> Dict[str, Any]:
+        """Odoo server version info (no authentication needed)"""
+        common = self.common or _server_proxy(f'{self.url}/xmlrpc/2/common', self.retry.timeout)
+        return common.version()
+
+    def _execute_kw(self, model, method, args, kwargs):
+        return self.models.execute_kw(
+            self.db, self.uid, self.password,
+            model, method, args, kwargs
+        )
+
+    def execute(self, model, method, *args, **kwargs):
+        """
+        Execute method on model
+
+        Transient failures (timeouts, connection resets, 502/503/504) are retried with
+        jittered backoff for read-only methods only. An access error triggers one
+        transparent re-authentication. The circuit breaker rejects calls up front
+        while Odoo keeps failing.
+        """
+        attempt = 0
+        reauthenticated = False
+        while True:
+            self.breaker.before_call()
+            try:
+                if not self.uid:
+                    self.connect()
+                result = self._execute_kw(model, method, args, kwargs)
+            except xmlrpc.client.Fault as e:
+                # Odoo menjawab, jadi server sehat walaupun request-nya gagal
+                self.breaker.record_success()
+                if not reauthenticated and _is_access_error(e):
+                    reauthenticated = True
+                    self.uid = 0
+                    continue
+                raise
+            except Exception as e:
+                if not _is_transient_error(e):
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if (method not in READ_ONLY_METHODS or attempt >= self.retry.max_retries
+                        or self.breaker.is_open):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+def _normalize_rpc_value(value):
+    """Convert JSON-RPC results to the shapes XML-RPC returns (Odoo sends None as False over XML-RPC)"""
+    if value is None:
+        return False
+    if isinstance(value, list):
+        return [_normalize_rpc_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _normalize_rpc_value(v) for k, v in value.items()}
+    return value
+
+
+def _jsonrpc_fault(error: Dict[str, Any]) -> xmlrpc.client.Fault:
+    """Turn a JSON-RPC error object into the Fault XML-RPC would have raised"""
+    data = error.get('data') or {}
+    message = data.get('debug') or data.get('message') or error.get('message', 'Odoo Server Error')
+    if data.get('name') and data['name'] not in message:
+        message = f"{data['name']}: {message}"
+    return xmlrpc.client.Fault(error.get('code', 1), message)
+
+
+def decode_jsonrpc_response(body: bytes, content_encoding: str = None):
+    """Decode a /jsonrpc response body: gunzip if needed, parse, raise errors, normalize shapes"""
+    if content_encoding == 'gzip':
+        body = gzip.decompress(body)
+    data = _json_loads(body)
+    if data.get('error'):
+        raise _jsonrpc_fault(data['error'])
+    return _normalize_rpc_value(data.get('result'))
+
+
+@dataclass
+class JsonRpcConnection(OdooConnection):
+    """
+    OdooConnection speaking Odoo's /jsonrpc endpoint
+
+    JSON decoding is much cheaper than xmlrpc.client's pure-Python unmarshalling for
+    large search_read results. Responses are requested gzip-compressed (honoured when a
+    reverse proxy in front of Odoo compresses application/json) and the HTTP connection
+    is kept alive between calls. Results and errors are normalized to match XML-RPC.
+    """
+    bytes_received: int = 0
+    _http: Any = dataclasses.field(default=None, repr=False, compare=False)
+    _ids: Any = dataclasses.field(default_factory=itertools.count, repr=False, compare=False)
+
+    def _http_connection(self):
+        if self._http is None:
+            parts = urlsplit(self.url)
+            connection_cls = (http.client.HTTPSConnection if parts.scheme == 'https'
+                              else http.client.HTTPConnection)
+            self._http = connection_cls(parts.netloc, timeout=self.retry.timeout)
+        return self._http
+
+    def _call(self, service: str, method: str, args: List):
+        payload = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': {'service': service, 'method': method, 'args': args},
+            'id': next(self._ids),
+        }).encode('utf-8')
+        path = urlsplit(self.url).path.rstrip('/') + '/jsonrpc'
+        # Seperti xmlrpc.client.Transport: kirim ulang sekali jika koneksi keep-alive
+        # sudah ditutup server selama idle
+        for attempt in (0, 1):
+            reused = self._http is not None
+            connection = self._http_connection()
+            try:
+                connection.request('POST', path, payload, {
+                    'Content-Type': 'application/json',
+                    'Accept-Encoding': 'gzip',
+                })
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    ConnectionAbortedError, BrokenPipeError):
+                connection.close()
+                self._http = None
+                if attempt or not reused:
+                    raise
+            except Exception:
+                connection.close()
+                self._http = None
+                raise
+        self.bytes_received += len(body)
+        if response.status != 200:
+            raise xmlrpc.client.ProtocolError(self.url + '/jsonrpc', response.status,
+                                              response.reason, dict(response.getheaders()))
+        return decode_jsonrpc_response(body, response.getheader('Content-Encoding'))
+
+    def connect(self):
+        """Establish connection to Odoo"""
+        self.uid = self._call('common', 'authenticate', [self.db, self.username, self.password, {}])
+        if not self.uid:
+            raise OdooError("Failed to authenticate with Odoo")
+        return self
+
+    def version(self) -> Dict[str, Any]:
+        """Odoo server version info (no authentication needed)"""
+        return self._call('common', 'version', [])
+
+    def _execute_kw(self, model, method, args, kwargs):
+        return self._call('object', 'execute_kw', [
+            self.db, self.uid, self.password, model, method, list(args), kwargs
+        ])
+
+
+# Transport yang bisa dipilih per target (env: ODOO_TRANSPORT)
+CONNECTION_CLASSES = {
+    'xmlrpc': OdooConnection,
+    'jsonrpc': JsonRpcConnection,
+}
+
+RELATIONAL_TYPES = ('many2one', 'one2many', 'many2many')
+
+# Atribut fields_get yang disimpan di schema cache
+SCHEMA_ATTRIBUTES = ['string', 'help', 'type', 'required', 'relation', 'store', 'size']
+
+DEFAULT_TARGET = 'default'
+
+
+@dataclass
+class TargetConfig:
+    """Connection settings for one named Odoo database"""
+    name: str
+    url: str
+    db: str
+    username: str
+    password: str
+    pool_size: int = 4
+    timeout: Optional[float] = None
+    transport: str = 'xmlrpc'
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> 'TargetConfig':
+        password = data.get('password')
+        if password is None and data.get('password_env'):
+            password = os.environ.get(data['password_env'], '')
+        return cls(
+            name=name,
+            url=data.get('url', 'http://localhost:8069'),
+            db=data.get('db', 'odoo'),
+            username=data.get('username') or data.get('user', 'admin'),
+            password=password or 'admin',
+            pool_size=int(data.get('pool_size', 4)),
+            timeout=data.get('timeout'),
+            transport=data.get('transport', os.environ.get('ODOO_TRANSPORT', 'xmlrpc')),
+        )
+
+
+class MemoryStore:
+    """In-process key/value store with expiry, used when no shared cache is configured"""
+
+    def __init__(self):
+        self._data: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str):
+        with self._lock:
+            entry = self._data.get((namespace, key))
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1]
+
+    def set(self, namespace: str, key: str, value, ttl: float):
+        with self._lock:
+            self._data[(namespace, key)] = (time.time() + ttl, value)
+
+    def delete(self, namespace: str, key: str = None):
+        with self._lock:
+            for item in [k for k in self._data if k[0] == namespace and (key is None or k[1] == key)]:
+                del self._data[item]
+
+
+class SqliteStore:
+    """
+    Key/value store in a SQLite file shared by every worker process (env: ODOO_MCP_CACHE_DB)
+
+    Values are stored as JSON with an absolute expiry time. WAL mode lets readers in
+    other processes proceed while one process writes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS cache ("
+                       "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                       "expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))")
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def get(self, namespace: str, key: str):
+        row = self._connection().execute(
+            "SELECT value FROM cache WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, key, time.time())).fetchone()
+        return _json_loads(row[0]) if row else None
+
+    def set(self, namespace: str, key: str, value, ttl: float):
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), time.time() + ttl))
+
+    def delete(self, namespace: str, key: str = None):
+        if key is None:
+            self._connection().execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+        else:
+            self._connection().execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+
+
+class SchemaCache:
+    """
+    Per-target cache of ir.model rows, fields_get results and record counts (env: ODOO_SCHEMA_TTL)
+
+    Entries live in process memory and, when a shared store is configured, are also
+    written to it so other worker processes start warm.
+    """
+
+    def __init__(self, ttl: float = 3600.0, store=None, namespace: str = ''):
+        self.ttl = ttl
+        self.store = store
+        self.namespace = namespace
+        self._entries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: str, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+        value = self.store.get(self.namespace, key) if self.store else None
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+                self._entries[key] = (now, value)
+            return value
+        with self._lock:
+            self.misses += 1
+        value = loader()
+        with self._lock:
+            self._entries[key] = (now, value)
+        if self.store:
+            self.store.set(self.namespace, key, value, self.ttl)
+        return value
+
+    def fields_get(self, odoo, model: str) -> Dict[str, Dict[str, Any]]:
+        return self._get(f'fields:{model}',
+                         lambda: odoo.execute(model, 'fields_get', [], SCHEMA_ATTRIBUTES))
+
+    def models(self, odoo) -> List[Dict[str, Any]]:
+        return self._get('models', lambda: odoo.execute(
+            'ir.model', 'search_read', [], ['name', 'model', 'info']))
+
+    def peek(self, key: str):
+        """Cached value without loading it (None when missing or expired)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+        return None
+
+    def count(self, odoo, model: str) -> int:
+        """Total record count, only used as a size estimate so TTL staleness is fine"""
+        return self._get(f'count:{model}', lambda: odoo.execute(model, 'search_count', []))
+
+    def invalidate(self, model: str = None):
+        with self._lock:
+            if model is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(f'fields:{model}', None)
+                self._entries.pop(f'count:{model}', None)
+        if self.store:
+            if model is None:
+                self.store.delete(self.namespace)
+            else:
+                self.store.delete(self.namespace, f'fields:{model}')
+                self.store.delete(self.namespace, f'count:{model}')
+
+    def export_entries(self) -> Dict[str, Any]:
+        """ir.model and fields_get entries for the metadata snapshot (counts are left out)"""
+        with self._lock:
+            return {key: entry[1] for key, entry in self._entries.items()
+                    if key == 'models' or key.startswith('fields:')}
+
+    def import_entries(self, entries: Dict[str, Any]):
+        now = time.monotonic()
+        with self._lock:
+            for key, value in entries.items():
+                self._entries.setdefault(key, (now, value))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Field relasi generik yang ada di hampir semua model; diabaikan agar path tidak lewat res.users dll.
+GENERIC_RELATION_FIELDS = frozenset({'create_uid', 'write_uid'})
+GENERIC_RELATION_PREFIXES = ('message_', 'activity_', 'website_message_', 'rating_')
+
+# Model teknis/hub yang tidak diekspansi lebih jauh saat menyusun ERD
+ERD_HUB_MODELS = frozenset({'res.users', 'res.company', 'res.currency', 'uom.uom'})
+ERD_HUB_PREFIXES = ('ir.', 'mail.', 'bus.', 'base.', 'rating.', 'portal.')
+
+
+def _is_generic_relation(field_name: str) -> bool:
+    return field_name in GENERIC_RELATION_FIELDS or field_name.startswith(GENERIC_RELATION_PREFIXES)
+
+
+def _is_hub_model(model: str) -> bool:
+    return model in ERD_HUB_MODELS or model.startswith(ERD_HUB_PREFIXES)
+
+
+class RelationGraph:
+    """
+    Adjacency graph of many2one/one2many/many2many fields from ir.model.fields
+
+    Built once per target and refreshed incrementally: only relational fields whose
+    write_date moved past the last seen value are fetched. A cheap search_count
+    detects removed fields (uninstalled modules) and triggers a full rebuild.
+    Refreshes are throttled to one per `refresh_interval` seconds.
+    """
+
+    def __init__(self, refresh_interval: float = 300.0):
+        self.refresh_interval = refresh_interval
+        self.edges: Dict[str, List[tuple]] = {}
+        self._fields: Dict[int, tuple] = {}
+        self._last_write_date = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self, odoo, force: bool = False) -> 'RelationGraph':
+        with self._lock:
+            if not force and self._fields and time.monotonic() - self._checked_at < self.refresh_interval:
+                return self
+            base_domain = [['ttype', 'in', list(RELATIONAL_TYPES)], ['relation', '!=', False]]
+            domain = base_domain
+            if self._last_write_date and not force:
+                total = odoo.execute('ir.model.fields', 'search_count', base_domain)
+                if total == len(self._fields):
+                    # '>=' karena write_date hanya presisi detik; baris yang sama ditimpa per id
+                    domain = base_domain + [['write_date', '>=', self._last_write_date]]
+                else:
+                    self._fields.clear()
+            else:
+                self._fields.clear()
+            rows = odoo.execute('ir.model.fields', 'search_read', domain,
+                                ['model', 'name', 'ttype', 'relation', 'write_date'])
+            for row in rows:
+                self._fields[row['id']] = (row['model'], row['name'], row['ttype'], row['relation'])
+                if row.get('write_date') and (self._last_write_date is None
+                                              or row['write_date'] > self._last_write_date):
+                    self._last_write_date = row['write_date']
+            if rows or not self.edges:
+                edges: Dict[str, List[tuple]] = collections.defaultdict(list)
+                for model, name, ttype, relation in self._fields.values():
+                    if not _is_generic_relation(name):
+                        edges[model].append((name, ttype, relation))
+                for items in edges.values():
+                    items.sort()
+                self.edges = dict(edges)
+            self._checked_at = time.monotonic()
+            return self
+
+    def neighbours(self, model: str) -> List[tuple]:
+        """(field, type, related model) for every relational field of the model"""
+        return self.edges.get(model, [])
+
+    def find_paths(self, source: str, destination: str, max_depth: int = 4,
+                   max_paths: int = 5) -> List[List[tuple]]:
+        """
+        All shortest field paths from source to destination (breadth-first search)
+
+        Each path is a list of (field, type, related model) hops. Paths with fewer
+        x2many hops come first since they do not multiply rows.
+        """
+        if source == destination:
+            return [[]]
+        parents: Dict[str, List[tuple]] = {source: []}
+        frontier = [source]
+        for _ in range(max_depth):
+            next_frontier = []
+            level: Dict[str, List[tuple]] = {}
+            for model in frontier:
+                for field_name, ttype, relation in self.neighbours(model):
+                    if relation in parents:
+                        continue
+                    level.setdefault(relation, []).append((model, field_name, ttype))
+            for relation, incoming in level.items():
+                parents[relation] = incoming
+                next_frontier.append(relation)
+            if destination in parents:
+                break
+            frontier = next_frontier
+            if not frontier:
+                break
+        if destination not in parents:
+            return []
+
+        paths: List[List[tuple]] = []
+
+        def walk(model, suffix):
+            if len(paths) >= max_paths * 4:
+                return
+            if model == source:
+                paths.append(suffix)
+                return
+            for parent, field_name, ttype in parents[model]:
+                walk(parent, [(field_name, ttype, model)] + suffix)
+
+        walk(destination, [])
+        paths.sort(key=lambda path: (sum(1 for _, ttype, _ in path if ttype != 'many2one'),
+                                     [hop[0] for hop in path]))
+        return paths[:max_paths]
+
+    def export_state(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'fields': [[field_id] + list(item) for field_id, item in self._fields.items()],
+                    'last_write_date': self._last_write_date}
+
+    def import_state(self, state: Dict[str, Any]):
+        """Load a snapshot; the next refresh() still checks Odoo for newer fields"""
+        with self._lock:
+            self._fields = {row[0]: tuple(row[1:]) for row in state.get('fields', [])}
+            self._last_write_date = state.get('last_write_date')
+            edges: Dict[str, List[tuple]] = collections.defaultdict(list)
+            for model, name, ttype, relation in self._fields.values():
+                if not _is_generic_relation(name):
+                    edges[model].append((name, ttype, relation))
+            for items in edges.values():
+                items.sort()
+            self.edges = dict(edges)
+
+    def reset(self):
+        with self._lock:
+            self._fields = {}
+            self.edges = {}
+            self._last_write_date = None
+            self._checked_at = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'models': len(self.edges), 'relations': len(self._fields),
+                'last_write_date': self._last_write_date}
+
+
+# Method murah yang selalu masuk lane prioritas 'metadata'
+METADATA_METHODS = frozenset({
+    'fields_get', 'search_count', 'name_get', 'default_get', 'check_access_rights',
+    'get_views', 'fields_view_get',
+})
+METADATA_MODELS = frozenset({'ir.model', 'ir.model.fields'})
+
+# Perkiraan jumlah baris bila search tanpa limit dan count belum ada di cache
+UNKNOWN_ROW_ESTIMATE = 10000
+# Perkiraan jumlah field bila search_read/read tanpa daftar field
+UNKNOWN_FIELD_ESTIMATE = 50
+
+
+def _call_argument(args: tuple, kwargs: Dict[str, Any], position: int, name: str):
+    if name in kwargs:
+        return kwargs[name]
+    return args[position] if len(args) > position else None
+
+
+class AdmissionScheduler:
+    """
+    Admission control in front of every Odoo call of a target
+
+    Each call is classified into a lane from a cost estimate (rows x fields, using
+    the limit or the cached record count):
+
+    - metadata: fields_get, search_count, ir.model reads... may use every slot
+    - light: small reads, always leave `reserved_slots` free for metadata calls
+    - heavy: large scans, capped at `heavy_concurrency`
+
+    Light/heavy calls are also limited per model. Lower lanes wait while a higher
+    lane has callers queued that could run now (a light call only waiting for its
+    own model's limit does not hold back heavy calls on other models). A call that waits longer than `queue_timeout`, or
+    arrives when its lane already has `max_queue` waiters, is rejected with
+    OdooOverloadedError so the agent gets clear backpressure instead of a hang.
+    """
+    LANES = ('metadata', 'light', 'heavy')
+
+    def __init__(self, max_concurrency: int = 4, heavy_concurrency: int = 2, model_concurrency: int = 2,
+                 max_queue: int = 16, queue_timeout: float = 30.0, heavy_cost: float = 20000,
+                 reserved_slots: int = 1):
+        self.max_concurrency = max(1, max_concurrency)
+        self.reserved_slots = min(reserved_slots, self.max_concurrency - 1)
+        self.heavy_concurrency = max(1, min(heavy_concurrency, self.max_concurrency - self.reserved_slots))
+        self.model_concurrency = max(1, model_concurrency)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.heavy_cost = heavy_cost
+        self._running = {lane: 0 for lane in self.LANES}
+        self._waiting = {lane: 0 for lane in self.LANES}
+        self._model_running: Dict[str, int] = {}
+        self._light_waiting: Dict[str, int] = {}
+        self.admitted = 0
+        self.shed = 0
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_env(cls, max_concurrency: int) -> 'AdmissionScheduler':
+        return cls(
+            max_concurrency=max_concurrency,
+            heavy_concurrency=_env_int('ODOO_HEAVY_CONCURRENCY', max(1, max_concurrency // 2)),
+            model_concurrency=_env_int('ODOO_MODEL_CONCURRENCY', 2),
+            max_queue=_env_int('ODOO_MAX_QUEUE', 16),
+            queue_timeout=_env_float('ODOO_QUEUE_TIMEOUT', 30.0),
+            heavy_cost=_env_float('ODOO_HEAVY_COST', 20000),
+        )
+
+    def classify(self, model: str, method: str, args: tuple, kwargs: Dict[str, Any],
+                 count_hint: Optional[int] = None):
+        """Return (lane, estimated cost) for a call, without contacting Odoo"""
+        if method in METADATA_METHODS or model in METADATA_MODELS:
+            return 'metadata', 1.0
+        rows = count_hint if count_hint is not None else UNKNOWN_ROW_ESTIMATE
+        fields = None
+        if method == 'search_read':
+            fields = _call_argument(args, kwargs, 1, 'fields')
+            limit = _call_argument(args, kwargs, 3, 'limit')
+            rows = min(rows, limit) if limit else rows
+        elif method == 'search':
+            limit = _call_argument(args, kwargs, 2, 'limit')
+            rows = min(rows, limit) if limit else rows
+            fields = ['id']
+        elif method == 'read':
+            ids = _call_argument(args, kwargs, 0, 'ids')
+            rows = len(ids) if isinstance(ids, (list, tuple)) else 1
+            fields = _call_argument(args, kwargs, 1, 'fields')
+        elif method == 'read_group':
+            # Agregasi dilakukan di database, jauh lebih murah per baris
+            rows = rows / 10
+            fields = ['id']
+        cost = float(rows) * (len(fields) if fields else UNKNOWN_FIELD_ESTIMATE)
+        return ('heavy' if cost >= self.heavy_cost else 'light'), cost
+
+    def _lane_limit(self, lane: str) -> int:
+        if lane == 'metadata':
+            return self.max_concurrency
+        if lane == 'light':
+            return self.max_concurrency - self.reserved_slots
+        return self.heavy_concurrency
+
+    def _light_ready(self) -> bool:
+        """True when a queued light call is held back by global capacity, not by its model's limit"""
+        return any(self._model_running.get(model, 0) < self.model_concurrency
+                   for model in self._light_waiting)
+
+    def _can_run(self, model: str, lane: str) -> bool:
+        running_total = sum(self._running.values())
+        if lane == 'metadata':
+            return running_total < self.max_concurrency
+        if self._waiting['metadata'] or (lane == 'heavy' and self._light_ready()):
+            return False
+        if running_total >= self._lane_limit('light'):
+            return False
+        if lane == 'heavy' and self._running['heavy'] >= self.heavy_concurrency:
+            return False
+        return self._model_running.get(model, 0) < self.model_concurrency
+
+    def _overloaded(self, model: str, lane: str, cost: float, reason: str) -> OdooOverloadedError:
+        self.shed += 1
+        return OdooOverloadedError(
+            f"Odoo is busy ({reason}): {sum(self._running.values())} calls running, "
+            f"{sum(self._waiting.values())} queued. {lane} call on {model} (estimated cost {cost:.0f}) "
+            f"was rejected - retry later, add a limit or request fewer fields")
+
+    @contextmanager
+    def admit(self, model: str, lane: str, cost: float = 0.0):
+        """Block until the call may run in its lane, or raise OdooOverloadedError"""
+        deadline = time.monotonic() + self.queue_timeout
+        with self._cond:
+            if not self._can_run(model, lane):
+                if self._waiting[lane] >= self.max_queue:
+                    raise self._overloaded(model, lane, cost, f"{lane} queue full")
+                self._waiting[lane] += 1
+                if lane == 'light':
+                    self._light_waiting[model] = self._light_waiting.get(model, 0) + 1
+                try:
+                    while not self._can_run(model, lane):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise self._overloaded(model, lane, cost,
+                                                   f"waited {self.queue_timeout:g}s in {lane} queue")
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting[lane] -= 1
+                    if lane == 'light':
+                        self._light_waiting[model] -= 1
+                        if not self._light_waiting[model]:
+                            del self._light_waiting[model]
+                    # Lane lain mungkin sedang menunggu lane ini kosong
+                    self._cond.notify_all()
+            self._running[lane] += 1
+            if lane != 'metadata':
+                self._model_running[model] = self._model_running.get(model, 0) + 1
+            self.admitted += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._running[lane] -= 1
+                if lane != 'metadata':
+                    self._model_running[model] -= 1
+                    if not self._model_running[model]:
+                        del self._model_running[model]
+                self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'running': dict(self._running),
+                'waiting': dict(self._waiting),
+                'models': dict(self._model_running),
+                'admitted': self.admitted,
+                'shed': self.shed,
+            }
+
+
+class TargetMetrics:
+    """Call counters and latency per target"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.by_method: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, seconds: float, failed: bool):
+        with self._lock:
+            self.calls += 1
+            self.errors += int(failed)
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self.by_method[method] = self.by_method.get(method, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'errors': self.errors,
+                'avg_ms': round(1000 * self.total_seconds / self.calls, 1) if self.calls else 0.0,
+                'max_ms': round(1000 * self.max_seconds, 1),
+                'by_method': dict(self.by_method),
+            }
+
+
+class ConnectionPool:
+    """
+    Bounded pool of OdooConnection objects for one target
+
+    ServerProxy keeps a single HTTP connection and is not thread-safe, so each
+    concurrent call checks out its own connection. All connections of a target
+    share the same retry policy and circuit breaker.
+    """
+
+    def __init__(self, config: TargetConfig, retry: RetryPolicy, breaker: CircuitBreaker):
+        self.config = config
+        self.retry = retry
+        self.breaker = breaker
+        self.size = max(1, config.pool_size)
+        self._idle: 'queue.LifoQueue[OdooConnection]' = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self.created = 0
+        self.in_use = 0
+
+    def _new_connection(self) -> OdooConnection:
+        with self._lock:
+            self.created += 1
+        connection_cls = CONNECTION_CLASSES[self.config.transport]
+        return connection_cls(self.config.url, self.config.db, self.config.username,
+                              self.config.password, retry=self.retry, breaker=self.breaker)
+
+    @contextmanager
+    def connection(self):
+        if not self._slots.acquire(timeout=self.retry.timeout):
+            raise OdooError(f"No free Odoo connection for target '{self.config.name}' "
+                            f"after {self.retry.timeout:.0f}s")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._new_connection()
+            with self._lock:
+                self.in_use += 1
+            try:
+                yield conn
+            finally:
+                with self._lock:
+                    self.in_use -= 1
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'size': self.size, 'created': self.created, 'in_use': self.in_use}
+
+
+SNAPSHOT_FORMAT = 1
+
+
+class MetadataSnapshot:
+    """
+    Model/field metadata of one target persisted to disk for warm cold-starts
+
+    The file (gzip JSON, env: ODOO_SNAPSHOT_DIR) holds the cached ir.model rows,
+    fields_get results and relation graph, together with the Odoo server version
+    and a change token (count and max write_date of ir.model and ir.model.fields)
+    taken before the metadata was read. At startup it is loaded without any RPC;
+    validate() then compares version and token with Odoo in the background and
+    drops the caches when the schema changed.
+    """
+
+    def __init__(self, target: 'OdooTarget', directory: str):
+        self.target = target
+        key = hashlib.sha1(f"{target.url}|{target.db}".encode('utf-8')).hexdigest()[:12]
+        safe_db = "".join(c if c.isalnum() or c in '-_' else '_' for c in target.db)
+        self.path = os.path.join(directory, f"snapshot-{safe_db}-{key}.json.gz")
+        self.server_version = None
+        self.change_token = None
+        self.loaded = False
+        self.validated = False
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with gzip.open(self.path, 'rb') as f:
+                data = _json_loads(f.read())
+            if not isinstance(data, dict):
+                raise ValueError("snapshot is not a JSON object")
+            if data.get('format') != SNAPSHOT_FORMAT or data.get('url') != self.target.url \
+                    or data.get('db') != self.target.db:
+                return False
+            self.target.schema.import_entries(data.get('schema', {}))
+            self.target.graph.import_state(data.get('graph', {}))
+        except Exception as e:
+            # File rusak (mis. terpotong) tidak boleh menggagalkan start server
+            print(f"Ignoring unreadable metadata snapshot {self.path}: {str(e)}")
+            self.target.schema.invalidate()
+            self.target.graph.reset()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            return False
+        self.server_version = data.get('server_version')
+        self.change_token = data.get('change_token')
+        self.loaded = True
+        return True
+
+    def current_token(self) -> str:
+        odoo = self.target
+        parts = []
+        for model in ('ir.model', 'ir.model.fields'):
+            count = odoo.execute(model, 'search_count', [])
+            latest = odoo.execute(model, 'search_read', [], ['write_date'], limit=1, order='write_date desc')
+            parts.append(f"{count}@{latest[0]['write_date'] if latest else ''}")
+        return "|".join(parts)
+
+    def validate(self) -> bool:
+        """Compare the snapshot with Odoo; drop the loaded metadata when it is stale"""
+        version = self.target.version().get('server_version')
+        token = self.current_token()
+        fresh = self.loaded and version == self.server_version and token == self.change_token
+        if self.loaded and not fresh:
+            print(f"Metadata snapshot of '{self.target.name}' is stale, reloading from Odoo")
+            self.target.schema.invalidate()
+            self.target.graph.reset()
+        self.server_version = version
+        self.change_token = token
+        self.validated = True
+        return fresh
+
+    def save(self):
+        if not self.validated:
+            # Tanpa token yang valid snapshot tidak bisa diverifikasi saat start berikutnya
+            return
+        data = {
+            'format': SNAPSHOT_FORMAT,
+            'url': self.target.url,
+            'db': self.target.db,
+            'server_version': self.server_version,
+            'change_token': self.change_token,
+            'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'schema': self.target.schema.export_entries(),
+            'graph': self.target.graph.export_state(),
+        }
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+class OdooTarget:
+    """One named Odoo database with its own pool, schema cache and metrics"""
+
+    def __init__(self, config: TargetConfig, store=None):
+        if config.transport not in CONNECTION_CLASSES:
+            raise OdooError(f"Unknown transport '{config.transport}' for target '{config.name}'. "
+                            f"Use one of: {', '.join(CONNECTION_CLASSES)}")
+        self.name = config.name
+        self.config = config
+        self.retry = RetryPolicy.from_env()
+        if config.timeout:
+            self.retry.timeout = float(config.timeout)
+        self.breaker = CircuitBreaker.from_env()
+        self.pool = ConnectionPool(config, self.retry, self.breaker)
+        self.scheduler = AdmissionScheduler.from_env(self.pool.size)
+        self.store = store or MemoryStore()
+        self.schema = SchemaCache(ttl=_env_float('ODOO_SCHEMA_TTL', 3600.0), store=store,
+                                  namespace=self.cache_namespace('schema'))
+        self.graph = RelationGraph(refresh_interval=_env_float('ODOO_GRAPH_REFRESH', 300.0))
+        self.metrics = TargetMetrics()
+        snapshot_dir = os.environ.get('ODOO_SNAPSHOT_DIR', _data_dir('snapshots'))
+        self.snapshot = MetadataSnapshot(self, snapshot_dir) if snapshot_dir else None
+
+    @property
+    def url(self) -> str:
+        return self.config.url
+
+    @property
+    def db(self) -> str:
+        return self.config.db
+
+    def cache_namespace(self, kind: str) -> str:
+        """Shared-store namespace; keyed by URL and database so targets never mix entries"""
+        return f"{kind}:{self.config.url}|{self.config.db}"
+
+    def connect(self) -> int:
+        """Authenticate one pooled connection up front, returns the uid"""
+        with self.pool.connection() as conn:
+            conn.connect()
+            return conn.uid
+
+    def version(self) -> Dict[str, Any]:
+        with self.pool.connection() as conn:
+            return conn.version()
+
+    def execute(self, model, method, *args, **kwargs):
+        """Execute method on model through the admission scheduler and a pooled connection"""
+        lane, cost = self.scheduler.classify(model, method, args, kwargs,
+                                             self.schema.peek(f'count:{model}'))
+        with self.scheduler.admit(model, lane, cost):
+            started = time.perf_counter()
+            failed = True
+            try:
+                with self.pool.connection() as conn:
+                    result = conn.execute(model, method, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.metrics.record(method, time.perf_counter() - started, failed)
+
+    def fields_get(self, model: str) -> Dict[str, Dict[str, Any]]:
+        """Cached fields_get with SCHEMA_ATTRIBUTES"""
+        return self.schema.fields_get(self, model)
+
+    def models(self) -> List[Dict[str, Any]]:
+        """Cached ir.model rows (name, model, info)"""
+        return self.schema.models(self)
+
+    def count(self, model: str) -> int:
+        """Cached total record count of a model"""
+        return self.schema.count(self, model)
+
+    def relation_graph(self) -> RelationGraph:
+        """Model relation graph, refreshed incrementally when stale"""
+        return self.graph.refresh(self)
+
+    def close(self):
+        self.pool.close()
+
+
+class OdooRegistry:
+    """All configured Odoo targets, looked up by name from the tools' `target` argument"""
+
+    def __init__(self, targets: List[TargetConfig], default: str = None, store=None):
+        if not targets:
+            raise OdooError("No Odoo target configured")
+        # Tanpa shared store (satu proses) schema cache cukup di memori target itu sendiri
+        self.store = store
+        self.targets: Dict[str, OdooTarget] = {cfg.name: OdooTarget(cfg, store) for cfg in targets}
+        self.default = default if default in self.targets else targets[0].name
+
+    def get(self, name: str = None) -> OdooTarget:
+        name = name or self.default
+        try:
+            return self.targets[name]
+        except KeyError:
+            raise OdooError(f"Unknown Odoo target '{name}'. "
+                            f"Available targets: {', '.join(sorted(self.targets))}")
+
+    def __iter__(self):
+        return iter(self.targets.values())
+
+    def load_snapshots(self):
+        """Load persisted metadata, then validate and save it periodically in a background thread"""
+        for target in self:
+            if target.snapshot and target.snapshot.load():
+                print(f"Loaded metadata snapshot for '{target.name}' from {target.snapshot.path}")
+        if any(target.snapshot for target in self):
+            self._stop = threading.Event()
+            self._snapshot_thread = threading.Thread(target=self._snapshot_loop, daemon=True,
+                                                     name='odoo-metadata-snapshot')
+            self._snapshot_thread.start()
+
+    def _snapshot_loop(self):
+        interval = _env_float('ODOO_SNAPSHOT_INTERVAL', 600.0)
+        while True:
+            for target in self:
+                if not target.snapshot:
+                    continue
+                try:
+                    if not target.snapshot.validated:
+                        target.snapshot.validate()
+                    target.snapshot.save()
+                except Exception as e:
+                    print(f"Metadata snapshot of '{target.name}' failed: {str(e)}")
+            if self._stop.wait(interval):
+                return
+
+    def save_snapshots(self):
+        for target in self:
+            if target.snapshot:
+                try:
+                    target.snapshot.save()
+                except Exception as e:
+                    print(f"Saving metadata snapshot of '{target.name}' failed: {str(e)}")
+
+    def close(self):
+        if getattr(self, '_stop', None):
+            self._stop.set()
+        self.save_snapshots()
+        for target in self:
+            target.close()
+
+
+def _env_target_config() -> TargetConfig:
+    """Single target built from ODOO_URL / ODOO_DB / ODOO_USER / ODOO_PASSWORD"""
+    # Check for both ODOO_USER and ODOO_USERNAME for compatibility
+    odoo_url = os.environ.get('ODOO_URL', 'http://localhost:8069')
+    odoo_db = os.environ.get('ODOO_DB', 'odoo')
+    
+    # Try both variable names - either ODOO_USER or ODOO_USERNAME
+    odoo_user = os.environ.get('ODOO_USER')
+    if odoo_user is None:
+        odoo_user = os.environ.get('ODOO_USERNAME', 'admin')
+        if odoo_user != 'admin':  # If we found ODOO_USERNAME
+            print("Using ODOO_USERNAME instead of ODOO_USER")
+    
+    odoo_password = os.environ.get('ODOO_PASSWORD', 'admin')
+    
+    return TargetConfig(DEFAULT_TARGET, odoo_url, odoo_db, odoo_user, odoo_password,
+                        pool_size=_env_int('ODOO_POOL_SIZE', 4),
+                        transport=os.environ.get('ODOO_TRANSPORT', 'xmlrpc'))
+
+
+def load_registry() -> OdooRegistry:
+    """
+    Build the target registry
+
+    When ODOO_TARGETS_FILE points to a JSON file, every entry of its "targets"
+    object becomes a named target:
+
+        {
+          "default": "jakarta",
+          "targets": {
+            "jakarta": {"url": "https://odoo.example.com", "db": "JKT",
+                        "username": "bot@example.com", "password_env": "ODOO_JKT_PASSWORD",
+                        "pool_size": 4, "transport": "jsonrpc"},
+            "surabaya": {"url": "https://odoo.example.com", "db": "SBY", ...}
+          }
+        }
+
+    Otherwise a single 'default' target is read from the ODOO_* environment variables.
+    Caches are shared between processes through SQLite when ODOO_MCP_CACHE_DB is set.
+    """
+    cache_db = os.environ.get('ODOO_MCP_CACHE_DB')
+    store = SqliteStore(cache_db) if cache_db else None
+    
+    targets_file = os.environ.get('ODOO_TARGETS_FILE')
+    if not targets_file:
+        return OdooRegistry([_env_target_config()], store=store)
+    
+    with open(targets_file, encoding='utf-8') as f:
+        data = json.load(f)
+    configs = [TargetConfig.from_dict(name, item) for name, item in data.get('targets', {}).items()]
+    return OdooRegistry(configs, data.get('default'), store=store)
+
+# --------- DOMAIN COMPILER ---------
+
+DOMAIN_OPERATORS = frozenset({
+    '=', '!=', '>', '>=', '<', '<=', '=?', '=like', '=ilike',
+    'like', 'not like', 'ilike', 'not ilike', 'in', 'not in',
+    'child_of', 'parent_of', 'any', 'not any',
+})
+
+OPERATOR_ALIASES = {'==': '=', '<>': '!='}
+
+# Tanpa limit, model dengan lebih dari jumlah record ini ditolak (env: ODOO_UNBOUNDED_MAX_ROWS)
+UNBOUNDED_MAX_ROWS = _env_int('ODOO_UNBOUNDED_MAX_ROWS', 50000)
+
+
+class DomainError(OdooError):
+    """Raised before any RPC when a domain or field list is invalid for the model"""
+
+
+@dataclass
+class CompiledDomain:
+    domain: List
+    unsatisfiable: bool = False
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _resolve_field_path(odoo, model: str, path: str) -> Dict[str, Any]:
+    """Walk a dotted field path through cached fields_get metadata, returns the last field's info"""
+    current_model = model
+    parts = path.split('.')
+    info: Dict[str, Any] = {}
+    for index, part in enumerate(parts):
+        fields_info = odoo.fields_get(current_model)
+        if part not in fields_info:
+            if part == 'id':
+                info = {'type': 'integer'}
+                continue
+            hint = difflib.get_close_matches(part, list(fields_info), n=3)
+            suggestion = f" Did you mean: {', '.join(hint)}?" if hint else ""
+            raise DomainError(f"Unknown field '{part}' on {current_model} (in '{path}').{suggestion}")
+        info = fields_info[part]
+        if index < len(parts) - 1:
+            if info.get('type') not in RELATIONAL_TYPES or not info.get('relation'):
+                raise DomainError(f"Field '{part}' on {current_model} is not relational, "
+                                  f"cannot follow '{path}'")
+            current_model = info['relation']
+    return info
+
+
+def validate_fields(odoo, model: str, fields: List[str]):
+    """Check field names (dotted paths allowed) against the cached schema"""
+    for field_name in fields or []:
+        _resolve_field_path(odoo, model, field_name)
+
+
+def _parse_domain(domain: List):
+    """Parse an Odoo prefix-notation domain into a tree of ('and'|'or', [...]), ('not', x) and leaves"""
+    tokens = list(domain)
+    position = 0
+
+    def parse():
+        nonlocal position
+        if position >= len(tokens):
+            raise DomainError("Domain ends before all '&', '|' or '!' operators got their operands")
+        token = tokens[position]
+        position += 1
+        if token in ('&', '|'):
+            left = parse()
+            right = parse()
+            return ('and' if token == '&' else 'or', [left, right])
+        if token == '!':
+            return ('not', parse())
+        if isinstance(token, (list, tuple)) and len(token) == 3:
+            return ('leaf', token)
+        raise DomainError(f"Invalid domain term {token!r}: expected [field, operator, value] "
+                          f"or one of '&', '|', '!'")
+
+    terms = []
+    while position < len(tokens):
+        terms.append(parse())
+    return ('and', terms)
+
+
+def _normalize_leaf(odoo, model: str, leaf):
+    field_name, operator, value = leaf
+    # Leaf khusus TRUE_LEAF / FALSE_LEAF dari Odoo
+    if (field_name, operator, value) == (1, '=', 1):
+        return ('true',)
+    if (field_name, operator, value) == (0, '=', 1):
+        return ('false',)
+    if not isinstance(field_name, str) or not isinstance(operator, str):
+        raise DomainError(f"Invalid domain leaf {list(leaf)!r}")
+    operator = ' '.join(operator.lower().split())
+    operator = OPERATOR_ALIASES.get(operator, operator)
+    if operator not in DOMAIN_OPERATORS:
+        raise DomainError(f"Unknown operator '{leaf[1]}' in {list(leaf)!r}. "
+                          f"Valid operators: {', '.join(sorted(DOMAIN_OPERATORS))}")
+    _resolve_field_path(odoo, model, field_name)
+    if isinstance(value, tuple):
+        value = list(value)
+    if operator in ('in', 'not in') and not isinstance(value, list):
+        value = [value]
+    if operator == 'in' and value == []:
+        return ('false',)
+    if operator == 'not in' and value == []:
+        return ('true',)
+    return ('leaf', (field_name, operator, value))
+
+
+def _contradicts(a, b) -> bool:
+    """True when two leaves on the same field can never hold together"""
+    field_a, op_a, value_a = a
+    field_b, op_b, value_b = b
+    if field_a != field_b:
+        return False
+    # 5 dan '5' bisa cocok dengan record yang sama setelah dikonversi oleh Odoo
+    values = (value_a if isinstance(value_a, list) else [value_a]) + \
+        (value_b if isinstance(value_b, list) else [value_b])
+    if len({type(v) for v in values}) > 1:
+        return False
+    frozen_a, frozen_b = _freeze(value_a), _freeze(value_b)
+    if op_a == '=' and op_b == '=':
+        return frozen_a != frozen_b
+    if {op_a, op_b} == {'=', '!='}:
+        return frozen_a == frozen_b
+    if op_a == '=' and op_b == 'in':
+        return value_a not in value_b
+    if op_a == 'in' and op_b == '=':
+        return value_b not in value_a
+    if op_a == 'in' and op_b == 'in':
+        return not set(map(_freeze, value_a)) & set(map(_freeze, value_b))
+    return False
+
+
+# Tipe field yang nilainya dibandingkan apa adanya oleh Odoo. Date/datetime/float/monetary
+# dinormalisasi di server ('2025-01-01' sama dengan '2025-01-01 00:00:00'), jadi diserahkan ke Odoo
+CONTRADICTION_TYPES = frozenset({'selection', 'char', 'boolean', 'integer', 'many2one'})
+
+
+def _single_valued(odoo, model: str, leaf) -> bool:
+    """
+    True when a leaf compares exactly one raw value per record, the only case where
+    two leaves on the same path can contradict each other. '=' on an x2many means
+    "contains", a path through an x2many can match a different line per leaf, a
+    string compared to a many2one is matched against the record name, and values
+    of other field types are converted by Odoo before comparing.
+    """
+    field_name, operator, value = leaf
+    current_model = model
+    parts = field_name.split('.')
+    for index, part in enumerate(parts):
+        info = odoo.fields_get(current_model).get(part, {'type': 'integer'})
+        if info.get('type') in ('one2many', 'many2many'):
+            return False
+        if index < len(parts) - 1:
+            current_model = info['relation']
+        elif info.get('type') == 'many2one':
+            values = value if isinstance(value, list) else [value]
+            return all(isinstance(v, int) for v in values)
+    return info.get('type') in CONTRADICTION_TYPES
+
+
+def _simplify(odoo, model: str, node):
+    kind = node[0]
+    if kind == 'leaf':
+        return _normalize_leaf(odoo, model, node[1])
+    if kind == 'not':
+        child = _simplify(odoo, model, node[1])
+        if child[0] in ('true', 'false'):
+            return ('false',) if child[0] == 'true' else ('true',)
+        return ('not', child)
+
+    # 'and' / 'or': ratakan grup yang sama, buang leaf duplikat
+    absorbing, neutral = ('false', 'true') if kind == 'and' else ('true', 'false')
+    children, seen = [], set()
+    for child in (_simplify(odoo, model, c) for c in node[1]):
+        if child[0] == absorbing:
+            return (absorbing,)
+        if child[0] == neutral:
+            continue
+        for item in (child[1] if child[0] == kind else [child]):
+            key = _freeze(item)
+            if key not in seen:
+                seen.add(key)
+                children.append(item)
+    if kind == 'and':
+        leaves = [c[1] for c in children if c[0] == 'leaf' and _single_valued(odoo, model, c[1])]
+        for i, leaf in enumerate(leaves):
+            if any(_contradicts(leaf, other) for other in leaves[i + 1:]):
+                return ('false',)
+    if not children:
+        return (neutral,)
+    if len(children) == 1:
+        return children[0]
+    return (kind, children)
+
+
+def _serialize(node) -> List:
+    kind = node[0]
+    if kind == 'leaf':
+        return [list(node[1])]
+    if kind == 'not':
+        return ['!'] + _serialize(node[1])
+    operator = '&' if kind == 'and' else '|'
+    result = [operator] * (len(node[1]) - 1)
+    for child in node[1]:
+        result.extend(_serialize(child))
+    return result
+
+
+def compile_domain(odoo, model: str, domain: List) -> CompiledDomain:
+    """
+    Validate and normalize a domain locally before sending it to Odoo
 
-    def connect(self):
-        """Establish connection to Odoo"""
-        self.common = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/common')
-        self.uid = self.common.authenticate(self.db, self.username, self.password, {})
-        if not self.uid:
-            raise Exception("Failed to authenticate with Odoo")
-        self.models = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/object')
-        return self
+    Field paths and operators are checked against the cached fields_get metadata,
+    operators are normalized ('==' -> '=', 'ILIKE' -> 'ilike'), the prefix notation
+    is rebuilt explicitly, duplicate leaves are removed and contradictory AND
+    groups (e.g. state = 'draft' AND state = 'sale') mark the domain unsatisfiable
+    so the caller can skip the RPC entirely. Raises DomainError on invalid input.
+    """
+    if not domain:
+        return CompiledDomain([])
+    if not isinstance(domain, (list, tuple)):
+        raise DomainError(f"Domain must be a list of [field, operator, value] triplets, got {domain!r}")
+    tree = _simplify(odoo, model, _parse_domain(domain))
+    if tree[0] == 'false':
+        return CompiledDomain([], unsatisfiable=True)
+    if tree[0] == 'true':
+        return CompiledDomain([])
+    if tree[0] == 'and':
+        # AND di level teratas cukup ditulis implisit
+        compiled = []
+        for child in tree[1]:
+            compiled.extend(_serialize(child))
+        return CompiledDomain(compiled)
+    return CompiledDomain(_serialize(tree))
 
-    def execute(self, model, method, *args, **kwargs):
-        """Execute method on model"""
-        return self.models.execute_kw(
-            self.db, self.uid, self.password, 
-            model, method, args, kwargs
-        )
 
-@asynccontextmanager
-async def odoo_lifespan(server: FastMCP) -> AsyncIterator[OdooConnection]:
-    """Manage Odoo connection lifecycle"""
-    # Get connection details from environment or config
-    import os
-    
-    # Log environment variables for debugging
-    env_vars = {k: v for k, v in os.environ.items() if k.startswith('ODOO_')}
-    print(f"Available Odoo environment variables: {env_vars.keys()}")
-    
-    # Check for both ODOO_USER and ODOO_USERNAME for compatibility
-    odoo_url = os.environ.get('ODOO_URL', 'http://localhost:8069')
-    odoo_db = os.environ.get('ODOO_DB', 'odoo')
-    
-    # Try both variable names - either ODOO_USER or ODOO_USERNAME
-    odoo_user = os.environ.get('ODOO_USER')
-    if odoo_user is None:
-        odoo_user = os.environ.get('ODOO_USERNAME', 'admin')
-        if odoo_user != 'admin':  # If we found ODOO_USERNAME
-            print("Using ODOO_USERNAME instead of ODOO_USER")
-    
-    odoo_password = os.environ.get('ODOO_PASSWORD', 'admin')
+# --------- FIELD PROJECTION ---------
+
+PROJECTION_PROFILES = ('minimal', 'default', 'full')
+
+# Tipe field yang mahal dihitung atau besar di payload
+LARGE_TEXT_TYPES = ('html', 'text')
+X2MANY_TYPES = ('one2many', 'many2many')
+# Char dengan size besar diperlakukan seperti text
+LARGE_CHAR_SIZE = 1024
+
+
+def plan_projection(fields_info: Dict[str, Dict[str, Any]], profile: str = 'default'):
+    """
+    Pick the fields to read when the caller did not name any
+
+    - full: every non-binary field
+    - default: stored scalar and many2one fields; skips binary, one2many/many2many id
+      lists, non-stored computed fields, html/text bodies and chatter/audit fields
+    - minimal: id, display_name, name, state and the required stored scalar fields
+
+    Returns (fields, skipped) where skipped maps a reason to the skipped field names.
+    """
+    if profile not in PROJECTION_PROFILES:
+        raise DomainError(f"Unknown profile '{profile}'. Use one of: {', '.join(PROJECTION_PROFILES)}")
+    fields: List[str] = []
+    skipped: Dict[str, List[str]] = {}
     
-    print(f"Connecting to Odoo at {odoo_url} with DB: {odoo_db}, User: {odoo_user}")
+    def skip(reason, name):
+        skipped.setdefault(reason, []).append(name)
     
-    # Create and initialize connection
-    odoo = OdooConnection(odoo_url, odoo_db, odoo_user, odoo_password)
+    for name, info in fields_info.items():
+        field_type = info.get('type')
+        if field_type == 'binary':
+            skip('binary', name)
+        elif profile == 'full' or name in ('id', 'display_name'):
+            fields.append(name)
+        elif field_type in X2MANY_TYPES:
+            skip('one2many/many2many', name)
+        elif not info.get('store', True):
+            skip('non-stored computed', name)
+        elif field_type in LARGE_TEXT_TYPES or (info.get('size') or 0) > LARGE_CHAR_SIZE:
+            skip('large text', name)
+        elif _is_generic_relation(name):
+            skip('chatter/audit', name)
+        elif profile == 'minimal' and not (name in ('name', 'state') or info.get('required')):
+            skip('not in minimal profile', name)
+        else:
+            fields.append(name)
+    return fields, skipped
+
+
+def _format_skipped(skipped: Dict[str, List[str]], limit: int = 15) -> str:
+    parts = []
+    for reason, names in skipped.items():
+        shown = ", ".join(names[:limit])
+        if len(names) > limit:
+            shown += f", ... (+{len(names) - limit})"
+        parts.append(f"{reason}: {shown}")
+    return "; ".join(parts)
+
+
+def check_bounded(odoo, model: str, domain: List, limit: Optional[int], allow_unbounded: bool = False):
+    """Reject a query without limit on a huge model unless explicitly allowed"""
+    if limit or allow_unbounded:
+        return
+    if odoo.count(model) <= UNBOUNDED_MAX_ROWS:
+        return
+    matching = odoo.execute(model, 'search_count', domain)
+    if matching > UNBOUNDED_MAX_ROWS:
+        raise DomainError(f"Query on {model} without limit would read {matching} records "
+                          f"(max {UNBOUNDED_MAX_ROWS}). Add a limit, narrow the domain, "
+                          f"or pass allow_unbounded=True")
+
+# Pada mode HTTP lifespan bisa dijalankan per request, jadi registry dipakai ulang per proses
+_registry: Optional[OdooRegistry] = None
+_registry_lock = threading.Lock()
+_keep_registry = False
+
+
+@asynccontextmanager
+async def odoo_lifespan(server: FastMCP) -> AsyncIterator[OdooRegistry]:
+    """Manage Odoo connection lifecycle"""
+    global _registry
+    with _registry_lock:
+        created = _registry is None
+        if created:
+            # Log environment variables for debugging
+            env_vars = {k: v for k, v in os.environ.items() if k.startswith('ODOO_')}
+            print(f"Available Odoo environment variables: {env_vars.keys()}")
+            
+            _registry = load_registry()
+            _registry.load_snapshots()
+            for target in _registry:
+                print(f"Connecting to Odoo target '{target.name}' at {target.url} "
+                      f"with DB: {target.db}, User: {target.config.username}")
+                try:
+                    uid = target.connect()
+                    print(f"Successfully connected to '{target.name}' as UID: {uid}")
+                except Exception as e:
+                    # Connections authenticate lazily, so the target stays usable once Odoo is reachable
+                    print(f"Error connecting to Odoo target '{target.name}': {str(e)}")
+        registry = _registry
     try:
-        print("Attempting to connect to Odoo...")
-        odoo.connect()
-        print(f"Successfully connected to Odoo as UID: {odoo.uid}")
-        yield odoo
-    except Exception as e:
-        print(f"Error connecting to Odoo: {str(e)}")
-        # Create minimal odoo connection for basic functionality
-        # This way some functions might still work even with connection issues
-        yield OdooConnection(odoo_url, odoo_db, odoo_user, odoo_password)
+        yield registry
     finally:
-        # No explicit cleanup needed for XML-RPC
-        print("Odoo connection cleanup")
-        pass
+        if created and not _keep_registry:
+            _close_registry()
+
+
+def _close_registry():
+    """Close pools and save metadata snapshots of the process registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            print("Odoo connection cleanup")
+            _registry.close()
+            _registry = None
+
+
+def _current_registry() -> OdooRegistry:
+    """Registry of this process for resources, which get no request context from FastMCP"""
+    if _registry is None:
+        raise OdooError("Odoo registry is not initialized (server lifespan has not started)")
+    return _registry
+
+
+def _in_thread(func):
+    """
+    Run a blocking tool/resource in a worker thread
+
+    FastMCP calls sync functions directly on the event loop, so Odoo calls, admission
+    queueing and retry backoff would otherwise stall every other request of the process.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs))
+    return wrapper
 
 # Create MCP server with Odoo context
 mcp = FastMCP("Odoo Explorer", lifespan=odoo_lifespan)
@@ -94,21 +1720,23 @@ mcp = FastMCP("Odoo Explorer", lifespan=odoo_lifespan)
 # --------- RESOURCES ---------
 
 @mcp.resource("odoo://models")
+@_in_thread
 def list_models() -> str:
     """List all available models in Odoo"""
-    odoo = mcp.app.lifespan_context
-    models = odoo.execute('ir.model', 'search_read', [], ['name', 'model', 'description'])
+    odoo = _current_registry().get()
+    models = odoo.models()
     
     result = "# Available Odoo Models\n\n"
     for model in models:
         result += f"## {model['name']} (`{model['model']}`)\n"
-        if model.get('description'):
-            result += f"{model['description']}\n"
+        if model.get('info'):
+            result += f"{model['info']}\n"
         result += "\n"
     
     return result
 
 @mcp.resource("odoo://model/{model}/schema")
+@_in_thread
 def get_model_schema(model: str) -> str:
     """
     Get schema for a specific Odoo model
@@ -120,7 +1748,7 @@ def get_model_schema(model: str) -> str:
         odoo://model/res.partner/schema
         odoo://model/sale.order/schema
     """
-    odoo = mcp.app.lifespan_context
+    odoo = _current_registry().get()
     
     # Get model info
     model_info = odoo.execute('ir.model', 'search_read', 
@@ -131,8 +1759,7 @@ def get_model_schema(model: str) -> str:
         return f"Error: Model '{model}' not found"
     
     # Get fields info
-    fields = odoo.execute(model, 'fields_get', [], 
-                         ['string', 'help', 'type', 'required', 'relation'])
+    fields = odoo.fields_get(model)
     
     # Format as markdown
     result = f"# {model_info[0]['name']} (`{model}`)\n\n"
@@ -156,16 +1783,61 @@ def get_model_schema(model: str) -> str:
     return result
 
 @mcp.resource("odoo://model/{model}/records/count")
+@_in_thread
 def get_record_count(model: str) -> str:
     """Get the number of records in a model"""
-    odoo = mcp.app.lifespan_context
+    odoo = _current_registry().get()
     count = odoo.execute(model, 'search_count', [])
     return f"# Record Count for {model}\n\nTotal records: {count}"
 
+@mcp.resource("odoo://health/breaker")
+def get_breaker_state() -> str:
+    """Circuit breaker state of every Odoo target"""
+    registry = _current_registry()
+    
+    result = "# Odoo Circuit Breaker\n\n"
+    result += "| Target | State | Consecutive Failures | Retry In (s) | Total Failures | Rejected |\n"
+    result += "| ------ | ----- | -------------------- | ------------ | -------------- | -------- |\n"
+    for target in registry:
+        state = target.breaker.snapshot()
+        result += (f"| {target.name} | {state['state']} | {state['consecutive_failures']} | "
+                   f"{state['retry_in']} | {state['total_failures']} | {state['total_rejected']} |\n")
+    
+    return result
+
+@mcp.resource("odoo://targets")
+def list_targets() -> str:
+    """List configured Odoo targets with their pool, schema cache and call metrics"""
+    registry = _current_registry()
+    
+    result = "# Odoo Targets\n\n"
+    for target in registry:
+        default = " (default)" if target.name == registry.default else ""
+        pool = target.pool.snapshot()
+        schema = target.schema.snapshot()
+        metrics = target.metrics.snapshot()
+        result += f"## {target.name}{default}\n\n"
+        result += f"- URL: {target.url}\n"
+        result += f"- Database: {target.db}\n"
+        result += f"- Transport: {target.config.transport}\n"
+        result += f"- Pool: {pool['in_use']}/{pool['size']} in use, {pool['created']} connections created\n"
+        result += f"- Schema cache: {schema['entries']} entries, {schema['hits']} hits, {schema['misses']} misses\n"
+        result += f"- Relation graph: {target.graph.snapshot()['models']} models\n"
+        scheduler = target.scheduler.snapshot()
+        result += (f"- Scheduler: running {scheduler['running']}, waiting {scheduler['waiting']}, "
+                   f"{scheduler['admitted']} admitted, {scheduler['shed']} shed\n")
+        result += (f"- Calls: {metrics['calls']} ({metrics['errors']} errors), "
+                   f"avg {metrics['avg_ms']} ms, max {metrics['max_ms']} ms\n")
+        result += f"- Circuit breaker: {target.breaker.state}\n\n"
+    
+    return result
+
 # --------- TOOLS ---------
 
 @mcp.tool()
-def search_records(ctx: Context, model: str, domain: List = None, limit: int = 1000, fields: List[str] = None) -> str:
+@_in_thread
+def search_records(ctx: Context, model: str, domain: List = None, limit: int = 1000, fields: List[str] = None,
+                   target: str = None, allow_unbounded: bool = False, profile: str = "default") -> str:
     """
     Search for records in an Odoo model
     
@@ -174,35 +1846,56 @@ def search_records(ctx: Context, model: str, domain: List = None, limit: int = 1
         domain: Domain filter as a list of triplets (e.g., [['is_company', '=', True], ['customer_rank', '>', 0]])
                Format: [[field_name, operator, value], ...] 
                Common operators: =, !=, >, >=, <, <=, like, ilike, in, not in
-        limit: Maximum number of records to return (default: 1000)
-        fields: List of fields to fetch (e.g., ['id', 'name', 'email']). If empty, returns all non-binary fields
+        limit: Maximum number of records to return (default: 1000). 0 means no limit
+        fields: List of fields to fetch (e.g., ['id', 'name', 'email']). If empty, fields are picked by profile
+        target: Name of the Odoo target (database) to query. Defaults to the default target
+        allow_unbounded: Allow limit=0 on very large models (default: False)
+        profile: Field set used when fields is empty (default: 'default'):
+                 'minimal' = id, name, state and required fields
+                 'default' = stored fields without one2many/many2many lists, html/text bodies and computed fields
+                 'full' = all non-binary fields (slow on wide models)
     
     Examples:
         search_records(model="res.partner", domain=[["is_company", "=", true], ["country_id.code", "=", "US"]], limit=10)
         search_records(model="product.product", fields=["name", "list_price", "default_code"])
         search_records(model="sale.order", domain=[["state", "=", "sale"]], fields=["name", "partner_id", "amount_total"])
+        search_records(model="res.partner", domain=[["customer_rank", ">", 0]], profile="minimal")
     """
     
     try:
         # Log mulai pencarian dengan parameter
         ctx.info(f"Searching {model} with domain: {domain}, limit: {limit}, fields: {fields}")
         
-        odoo = ctx.request_context.lifespan_context
+        odoo = ctx.request_context.lifespan_context.get(target)
         
         # Default domain and fields if not provided
         if domain is None:
             domain = []
-        if fields is None:
+        skipped = {}
+        if not fields:
             # Get model fields first
             try:
-                available_fields = odoo.execute(model, 'fields_get', [], ['type'])
-                # Filter out binary fields that could be large
-                fields = [f for f, info in available_fields.items() 
-                         if info.get('type') not in ['binary']]
+                available_fields = odoo.fields_get(model)
+                # Pilih field murah sesuai profile (binary tidak pernah diambil)
+                fields, skipped = plan_projection(available_fields, profile)
+            except DomainError as profile_error:
+                return f"Error: {str(profile_error)}"
             except Exception as field_error:
                 ctx.error(f"Error getting fields for {model}: {str(field_error)}")
                 fields = ['id', 'name', 'display_name']  # Fallback to basic fields
         
+        # Validasi domain dan field secara lokal sebelum mengirim ke Odoo
+        try:
+            compiled = compile_domain(odoo, model, domain)
+            validate_fields(odoo, model, fields)
+            check_bounded(odoo, model, compiled.domain, limit, allow_unbounded)
+        except DomainError as domain_error:
+            ctx.error(f"Invalid query: {str(domain_error)}")
+            return f"Error: {str(domain_error)}"
+        if compiled.unsatisfiable:
+            return f"No records found for {model}: the domain contains contradictory conditions."
+        domain = compiled.domain
+        
         # Execute search with timeout handling
         try:
             ctx.info(f"Executing search_read on {model}")
@@ -218,6 +1911,10 @@ def search_records(ctx: Context, model: str, domain: List = None, limit: int = 1
         # Format results as a table
         result = f"# Search Results for {model}\n\n"
         result += f"Found {len(records)} records (limit: {limit}).\n\n"
+        if skipped:
+            skipped_count = sum(len(names) for names in skipped.values())
+            result += (f"Skipped {skipped_count} fields (profile '{profile}'; pass fields=[...] or "
+                       f"profile='full' to include them): {_format_skipped(skipped)}\n\n")
         
         # Get column headers (fields)
         headers = list(records[0].keys())
@@ -251,8 +1948,9 @@ def search_records(ctx: Context, model: str, domain: List = None, limit: int = 1
         return error_message
 
 @mcp.tool()
+@_in_thread
 def run_report(ctx: Context, model: str, report_name: str, domain: List = None, group_by: List[str] = None, 
-             measures: List[str] = None) -> str:
+             measures: List[str] = None, target: str = None, allow_unbounded: bool = False) -> str:
     """
     Run a simple aggregation report on Odoo model data
     
@@ -263,6 +1961,8 @@ def run_report(ctx: Context, model: str, report_name: str, domain: List = None,
                Format: [[field_name, operator, value], ...]
         group_by: Fields to group by (e.g., ['partner_id', 'user_id']) - REQUIRED
         measures: Numeric fields to aggregate (e.g., ['amount_total', 'amount_untaxed'])
+        target: Name of the Odoo target (database) to query. Defaults to the default target
+        allow_unbounded: Allow reports that read more records than the configured maximum (default: False)
     
     Examples:
         run_report(
@@ -284,7 +1984,7 @@ def run_report(ctx: Context, model: str, report_name: str, domain: List = None,
     try:
         ctx.info(f"Running report on {model} with domain: {domain}, group_by: {group_by}, measures: {measures}")
         
-        odoo = ctx.request_context.lifespan_context
+        odoo = ctx.request_context.lifespan_context.get(target)
         
         if domain is None:
             domain = []
@@ -299,6 +1999,17 @@ def run_report(ctx: Context, model: str, report_name: str, domain: List = None,
         if measures:
             all_fields.extend(measures)
         
+        try:
+            compiled = compile_domain(odoo, model, domain)
+            validate_fields(odoo, model, all_fields)
+            check_bounded(odoo, model, compiled.domain, None, allow_unbounded)
+        except DomainError as domain_error:
+            ctx.error(f"Invalid report query: {str(domain_error)}")
+            return f"Error: {str(domain_error)}"
+        if compiled.unsatisfiable:
+            return f"No data found for model {model}: the domain contains contradictory conditions."
+        domain = compiled.domain
+        
         try:
             ctx.info(f"Fetching data from {model} with fields: {all_fields}")
             records = odoo.execute(model, 'search_read', domain, all_fields)
@@ -389,13 +2100,15 @@ def run_report(ctx: Context, model: str, report_name: str, domain: List = None,
         return error_message
     
 @mcp.tool()
-def get_contextual_metadata(ctx: Context, keywords: List[str], depth: int = 2) -> str:
+@_in_thread
+def get_contextual_metadata(ctx: Context, keywords: List[str], depth: int = 2, target: str = None) -> str:
     """
     Mengambil metadata dan ERD kontekstual untuk model-model yang terkait dengan kata kunci yang diberikan
     
     Args:
         keywords: Daftar kata kunci untuk mencari model yang relevan (misal: ['sale', 'invoice'])
         depth: Kedalaman relasi yang akan diambil (default: 2)
+        target: Nama target Odoo (database) yang digunakan (default: target default)
     
     Examples:
         get_contextual_metadata(keywords=["sale", "order"])
@@ -407,11 +2120,11 @@ def get_contextual_metadata(ctx: Context, keywords: List[str], depth: int = 2) -
     """
     try:
         ctx.info(f"Getting contextual metadata for keywords: {keywords}, depth: {depth}")
-        odoo = ctx.request_context.lifespan_context
+        odoo = ctx.request_context.lifespan_context.get(target)
         
         # Langkah 1: Temukan model yang cocok dengan kata kunci
         matching_models = []
-        all_models = odoo.execute('ir.model', 'search_read', [], ['name', 'model', 'info'])
+        all_models = odoo.models()
         
         for model_data in all_models:
             model_name = model_data.get('model', '')
@@ -433,34 +2146,31 @@ def get_contextual_metadata(ctx: Context, keywords: List[str], depth: int = 2) -
         for model_data in matching_models:
             model_name = model_data.get('model')
             related_models.add(model_name)
+        matching_names = set(related_models)
         
-        # Kumpulkan model terkait sampai kedalaman yang ditentukan
-        current_depth = 0
-        while current_depth < depth:
+        # Kumpulkan model terkait sampai kedalaman yang ditentukan lewat relation graph
+        # (tanpa fields_get per model), model hub/teknis tidak diekspansi lebih jauh
+        graph = odoo.relation_graph()
+        frontier = set(related_models)
+        for _ in range(depth - 1):
             new_related = set()
-            
-            for model_name in related_models:
-                if model_name not in metadata:
-                    try:
-                        # Dapatkan info field untuk model ini
-                        fields_info = odoo.execute(model_name, 'fields_get', [], 
-                                                ['string', 'help', 'type', 'required', 'relation'])
-                        
-                        metadata[model_name] = {
-                            'name': model_name,
-                            'fields': fields_info
-                        }
-                        
-                        # Tambahkan model terkait untuk iterasi berikutnya
-                        for field_name, field_info in fields_info.items():
-                            if field_info.get('type') in ['many2one', 'one2many', 'many2many'] and field_info.get('relation'):
-                                new_related.add(field_info['relation'])
-                    except Exception as e:
-                        ctx.error(f"Error fetching fields for {model_name}: {str(e)}")
-            
-            # Tambahkan model terkait baru
-            related_models.update(new_related)
-            current_depth += 1
+            for model_name in frontier:
+                if model_name not in matching_names and _is_hub_model(model_name):
+                    continue
+                new_related.update(relation for _, _, relation in graph.neighbours(model_name)
+                                   if not _is_hub_model(relation))
+            frontier = new_related - related_models
+            related_models.update(frontier)
+        
+        for model_name in sorted(related_models):
+            try:
+                # Dapatkan info field untuk model ini
+                metadata[model_name] = {
+                    'name': model_name,
+                    'fields': odoo.fields_get(model_name)
+                }
+            except Exception as e:
+                ctx.error(f"Error fetching fields for {model_name}: {str(e)}")
         
         # Langkah 3: Format hasil sebagai markdown
         result = f"# Contextual Entity Relationship Diagram (ERD) for keywords: {', '.join(keywords)}\n\n"
@@ -513,9 +2223,58 @@ def get_contextual_metadata(ctx: Context, keywords: List[str], depth: int = 2) -
         return error_message
 
 @mcp.tool()
+@_in_thread
+def find_join_path(ctx: Context, from_model: str, to_model: str, max_depth: int = 4, max_paths: int = 5,
+                   target: str = None) -> str:
+    """
+    Mencari path relasi terpendek (notasi dot) dari satu model ke model lain
+    
+    Args:
+        from_model: Model asal (misal: 'sale.order.line')
+        to_model: Model tujuan (misal: 'account.account')
+        max_depth: Jumlah hop relasi maksimum (default: 4)
+        max_paths: Jumlah path terpendek maksimum yang ditampilkan (default: 5)
+        target: Nama target Odoo (database) yang digunakan (default: target default)
+    
+    Examples:
+        find_join_path(from_model="sale.order.line", to_model="account.account")
+        find_join_path(from_model="stock.move", to_model="res.partner", max_depth=2)
+    
+    Returns:
+        Path dalam notasi dot yang bisa langsung dipakai di domain atau field advanced_query
+    """
+    try:
+        ctx.info(f"Finding join path from {from_model} to {to_model}")
+        odoo = ctx.request_context.lifespan_context.get(target)
+        graph = odoo.relation_graph()
+        
+        started = time.perf_counter()
+        paths = graph.find_paths(from_model, to_model, max_depth=max_depth, max_paths=max_paths)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        if not paths:
+            return (f"No relation path found from {from_model} to {to_model} "
+                    f"within {max_depth} hops (searched in {elapsed_ms:.1f} ms).")
+        
+        result = f"# Join paths from {from_model} to {to_model}\n\n"
+        result += f"Found {len(paths)} shortest path(s) of {len(paths[0])} hop(s) in {elapsed_ms:.1f} ms.\n\n"
+        for path in paths:
+            dotted = ".".join(hop[0] for hop in path)
+            hops = " → ".join([from_model] + [f"{relation} (`{field_name}`, {ttype})"
+                                             for field_name, ttype, relation in path])
+            result += f"- `{dotted}`\n  {hops}\n"
+        return result
+    except Exception as e:
+        error_message = f"Error in find_join_path: {str(e)}"
+        ctx.error(error_message)
+        return error_message
+
+@mcp.tool()
+@_in_thread
 def advanced_query(ctx: Context, main_model: str, fields: List[str], joins: List[Dict] = None, 
                  filters: List = None, group_by: List[str] = None, aggregations: Dict = None,
-                 limit: int = None, order: str = None) -> str:
+                 limit: int = None, order: str = None, target: str = None,
+                 allow_unbounded: bool = False) -> str:
     """
     Melakukan query lanjutan dengan dukungan untuk join antar model, filter kompleks, dan agregasi
     
@@ -528,6 +2287,8 @@ def advanced_query(ctx: Context, main_model: str, fields: List[str], joins: List
         aggregations: Operasi agregasi untuk field numerik {"field": ["sum", "avg"], ...}
         limit: Batas jumlah record yang diambil (default: 100)
         order: Field dan arah pengurutan (misal: 'date_order desc, id')
+        target: Nama target Odoo (database) yang digunakan (default: target default)
+        allow_unbounded: Izinkan query tanpa limit pada model yang sangat besar (default: False)
     
     Examples:
         advanced_query(
@@ -548,7 +2309,7 @@ def advanced_query(ctx: Context, main_model: str, fields: List[str], joins: List
     """
     try:
         ctx.info(f"Running advanced query on {main_model}")
-        odoo = ctx.request_context.lifespan_context
+        odoo = ctx.request_context.lifespan_context.get(target)
         
         # Default values
         if joins is None:
@@ -579,8 +2340,17 @@ def advanced_query(ctx: Context, main_model: str, fields: List[str], joins: List
                 # Field normal
                 query_fields.append(field)
         
-        # Langkah 2: Buat domain untuk filter
-        domain = filters
+        # Langkah 2: Buat domain untuk filter, divalidasi terhadap skema sebelum RPC
+        try:
+            validate_fields(odoo, main_model, fields + (group_by or []))
+            compiled = compile_domain(odoo, main_model, filters)
+            check_bounded(odoo, main_model, compiled.domain, limit, allow_unbounded)
+        except DomainError as domain_error:
+            ctx.error(f"Invalid query: {str(domain_error)}")
+            return f"Error: {str(domain_error)}"
+        if compiled.unsatisfiable:
+            return "No records found matching the criteria (contradictory filters)."
+        domain = compiled.domain
         
         # Langkah 3: Jalankan query sesuai kondisi
         if group_by and aggregations:
@@ -718,9 +2488,574 @@ def advanced_query(ctx: Context, main_model: str, fields: List[str], joins: List
         ctx.error(error_message)
         return error_message
 
+BATCH_QUERY_TYPES = ('search', 'count', 'report', 'read')
+
+
+def _format_cell(value) -> str:
+    """Format one Odoo value for a markdown table cell"""
+    if isinstance(value, (list, tuple)):
+        if len(value) == 2 and isinstance(value[0], int) and isinstance(value[1], str):
+            # Many2one (id, name)
+            value = value[1]
+        else:
+            value = str(value)
+    elif value is False or value is None:
+        value = ""
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def _markdown_table(rows: List[Dict[str, Any]], headers: List[str] = None) -> str:
+    if not rows:
+        return "_No records._\n"
+    headers = headers or list(rows[0].keys())
+    result = "| " + " | ".join(headers) + " |\n"
+    result += "| " + " | ".join(["---" for _ in headers]) + " |\n"
+    for row in rows:
+        result += "| " + " | ".join(_format_cell(row.get(h, "")) for h in headers) + " |\n"
+    return result
+
+
+def _run_batch_item(registry, default_target: str, query: Dict[str, Any]) -> str:
+    """Execute one batch_query sub-query and return its markdown body"""
+    query_type = query.get('type', 'search')
+    model = query.get('model')
+    if query_type not in BATCH_QUERY_TYPES:
+        raise DomainError(f"Unknown query type '{query_type}'. Use one of: {', '.join(BATCH_QUERY_TYPES)}")
+    if not model:
+        raise DomainError("Missing 'model'")
+    odoo = registry.get(query.get('target') or default_target)
+    
+    if query_type == 'read':
+        ids = query.get('ids') or []
+        fields = query.get('fields') or ['display_name']
+        validate_fields(odoo, model, fields)
+        records = odoo.execute(model, 'read', ids, fields)
+        return f"Read {len(records)} of {len(ids)} records.\n\n" + _markdown_table(records, ['id'] + [
+            f for f in fields if f != 'id'])
+    
+    compiled = compile_domain(odoo, model, query.get('domain') or [])
+    if query_type == 'count':
+        count = 0 if compiled.unsatisfiable else odoo.execute(model, 'search_count', compiled.domain)
+        return f"Count: **{count}**\n"
+    
+    if query_type == 'report':
+        group_by = query.get('group_by') or []
+        measures = query.get('measures') or []
+        if not group_by:
+            raise DomainError("'group_by' is required for report queries")
+        validate_fields(odoo, model, group_by + measures)
+        if compiled.unsatisfiable:
+            return _markdown_table([])
+        groups = odoo.execute(model, 'read_group', compiled.domain,
+                              [f"{m}:sum" for m in measures], group_by,
+                              lazy=False, limit=query.get('limit'))
+        rows = [{**{g: group.get(g) for g in group_by},
+                 'count': group.get('__count', group.get(f"{group_by[0]}_count")),
+                 **{f"sum({m})": group.get(m) for m in measures}} for group in groups]
+        return _markdown_table(rows, group_by + ['count'] + [f"sum({m})" for m in measures])
+    
+    # search
+    fields = query.get('fields') or ['display_name']
+    limit = query.get('limit') or 100
+    validate_fields(odoo, model, fields)
+    if compiled.unsatisfiable:
+        return _markdown_table([])
+    records = odoo.execute(model, 'search_read', compiled.domain, fields,
+                           offset=query.get('offset', 0), limit=limit, order=query.get('order'))
+    return f"Found {len(records)} records (limit: {limit}).\n\n" + _markdown_table(records, ['id'] + [
+        f for f in fields if f != 'id'])
+
+
+@mcp.tool()
+@_in_thread
+def batch_query(ctx: Context, queries: List[Dict], max_concurrency: int = 4, target: str = None) -> str:
+    """
+    Run several independent queries concurrently and return all results in one response
+    
+    Args:
+        queries: List of sub-queries. Each item is a dict with:
+                 - type: 'search' (default), 'count', 'report' or 'read'
+                 - model: Odoo model name
+                 - id: optional label shown in the result
+                 - domain: domain filter (search, count, report)
+                 - fields: fields to fetch (search, read). Default: ['display_name']
+                 - limit, offset, order: paging for search (default limit: 100)
+                 - group_by, measures: grouping and summed fields for report (server-side read_group)
+                 - ids: record ids for read
+                 - target: optional Odoo target for this item
+        max_concurrency: Maximum number of sub-queries running at the same time (default: 4)
+        target: Default Odoo target for items without their own target
+    
+    Examples:
+        batch_query(queries=[
+            {"id": "open_orders", "type": "count", "model": "sale.order", "domain": [["state", "=", "sale"]]},
+            {"id": "top_customers", "type": "search", "model": "res.partner",
+             "domain": [["customer_rank", ">", 0]], "fields": ["name", "email"], "order": "customer_rank desc", "limit": 5},
+            {"id": "sales_by_user", "type": "report", "model": "sale.order",
+             "group_by": ["user_id"], "measures": ["amount_total"]},
+            {"type": "read", "model": "product.product", "ids": [1, 2, 3], "fields": ["name", "list_price"]}
+        ])
+    
+    Returns:
+        One markdown section per sub-query with its status, timing and result
+    """
+    try:
+        if not queries:
+            return "Error: queries must contain at least one sub-query"
+        registry = ctx.request_context.lifespan_context
+        workers = max(1, min(max_concurrency, len(queries)))
+        ctx.info(f"Running batch of {len(queries)} queries with concurrency {workers}")
+        
+        def run(query):
+            started = time.perf_counter()
+            try:
+                body = _run_batch_item(registry, target, query)
+                ok = True
+            except Exception as e:
+                body = f"Error: {str(e)}\n"
+                ok = False
+            return ok, body, time.perf_counter() - started
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(run, queries))
+        elapsed = time.perf_counter() - started
+        
+        failed = sum(1 for ok, _, _ in outcomes if not ok)
+        sequential = sum(seconds for _, _, seconds in outcomes)
+        result = "# Batch Query Results\n\n"
+        result += (f"{len(queries)} queries, {failed} failed, wall time {elapsed * 1000:.0f} ms "
+                   f"(sum of queries {sequential * 1000:.0f} ms).\n\n")
+        for index, (query, (ok, body, seconds)) in enumerate(zip(queries, outcomes), start=1):
+            label = query.get('id') or index
+            status = "ok" if ok else "error"
+            result += (f"## [{label}] {query.get('type', 'search')} {query.get('model', '')} "
+                       f"- {status} ({seconds * 1000:.0f} ms)\n\n")
+            result += body + "\n"
+        return result
+    except Exception as e:
+        error_message = f"Error in batch_query: {str(e)}"
+        ctx.error(error_message)
+        return error_message
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+
+# Tipe field Odoo -> tipe kolom Parquet
+PARQUET_TYPES = {
+    'integer': 'int64', 'many2one': 'int64',
+    'float': 'float64', 'monetary': 'float64',
+    'boolean': 'bool_',
+}
+
+
+def _export_value(value, field_type: str, flat: bool):
+    """Convert an Odoo value for export; flat formats (csv/parquet) get scalars only"""
+    if field_type == 'boolean':
+        return bool(value)
+    if value is False or value is None:
+        return None
+    if field_type == 'many2one' and isinstance(value, (list, tuple)):
+        return value[0] if flat else list(value)
+    if flat and isinstance(value, (list, tuple, dict)):
+        return json.dumps(value)
+    return value
+
+
+class _ExportJob:
+    """
+    State of one export_model run, persisted next to the output file
+
+    The id range of the domain is split into slices, one per worker. Each slice
+    appends its chunks to its own part file and records the last exported id and
+    the part file size, so an interrupted export resumes exactly where every
+    slice stopped (partially written chunks are truncated away).
+    """
+
+    def __init__(self, path: str, spec: Dict[str, Any]):
+        self.path = path
+        self.state_path = f"{path}.export.json"
+        self.spec = spec
+        self.slices: List[Dict[str, Any]] = []
+        self.resumed = False
+        self._lock = threading.Lock()
+
+    def part_path(self, index: int) -> str:
+        return f"{self.path}.part{index}"
+
+    def load(self) -> bool:
+        """Load a previous state for the same export spec, returns True when resuming"""
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get('spec') != self.spec:
+            return False
+        self.slices = state['slices']
+        for index, item in enumerate(self.slices):
+            part = self.part_path(index)
+            if os.path.exists(part):
+                with open(part, 'r+b') as f:
+                    f.truncate(item['bytes'])
+            else:
+                item.update(last_id=item['lo'] - 1, rows=0, bytes=0, done=False)
+        self.resumed = True
+        return True
+
+    def plan(self, lo: int, hi: int, workers: int):
+        step = max(1, -(-(hi - lo + 1) // workers))
+        self.slices = []
+        for start in range(lo, hi + 1, step):
+            self.slices.append({'lo': start, 'hi': min(hi, start + step - 1),
+                                'last_id': start - 1, 'rows': 0, 'bytes': 0, 'done': False})
+        for index in range(len(self.slices)):
+            if os.path.exists(self.part_path(index)):
+                os.remove(self.part_path(index))
+        self.save()
+
+    def update_slice(self, index: int, **values):
+        """Update one slice's progress under the lock so save() never sees half of it"""
+        with self._lock:
+            self.slices[index].update(values)
+
+    def save(self):
+        with self._lock:
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'spec': self.spec, 'slices': self.slices}, f)
+            os.replace(tmp_path, self.state_path)
+
+    def cleanup(self):
+        for index in range(len(self.slices)):
+            if os.path.exists(self.part_path(index)):
+                os.remove(self.part_path(index))
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+
+def _export_slice(odoo, job: _ExportJob, index: int, domain: List, fields: List[str],
+                  field_types: Dict[str, str], export_format: str, chunk_size: int, log):
+    """Page through one id slice in id order, appending each chunk to the slice's part file"""
+    item = job.slices[index]
+    flat = export_format == 'csv'
+    with open(job.part_path(index), 'a', encoding='utf-8', newline='') as part:
+        writer = csv.writer(part) if flat else None
+        while not item['done']:
+            chunk_domain = domain + [['id', '>', item['last_id']], ['id', '<=', item['hi']]]
+            records = odoo.execute(job.spec['model'], 'search_read', chunk_domain, fields,
+                                   limit=chunk_size, order='id asc')
+            for record in records:
+                if flat:
+                    writer.writerow([_export_value(record.get(f), field_types.get(f), True) for f in fields])
+                else:
+                    row = {f: _export_value(record.get(f), field_types.get(f), False) for f in fields}
+                    part.write(json.dumps(row, default=str) + "\n")
+            part.flush()
+            # last_id, rows dan bytes harus tersimpan bersamaan agar resume tidak kehilangan chunk
+            job.update_slice(index,
+                             last_id=records[-1]['id'] if records else item['last_id'],
+                             rows=item['rows'] + len(records),
+                             bytes=part.tell(),
+                             done=len(records) < chunk_size)
+            job.save()
+            log(f"Slice {index}: {item['rows']} rows exported (last id {item['last_id']})")
+
+
+def _export_path(path: str) -> str:
+    """Resolve an export path inside ODOO_EXPORT_DIR, rejecting anything that escapes it"""
+    export_dir = os.path.realpath(os.environ.get('ODOO_EXPORT_DIR', os.path.join(os.getcwd(), 'exports')))
+    resolved = os.path.realpath(os.path.join(export_dir, path))
+    if os.path.commonpath([export_dir, resolved]) != export_dir or resolved == export_dir:
+        raise ValueError(f"Export path '{path}' is outside the export directory {export_dir}")
+    return resolved
+
+
+def _assemble_export(job: _ExportJob, fields: List[str], field_types: Dict[str, str],
+                     export_format: str, chunk_size: int, overwrite: bool = False):
+    """Concatenate the part files (in id order) into the final output file"""
+    tmp_path = f"{job.path}.tmp"
+    if export_format == 'parquet':
+        schema = pyarrow.schema([
+            (f, getattr(pyarrow, PARQUET_TYPES.get(field_types.get(f), 'string'))())
+            for f in fields
+        ])
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for index in range(len(job.slices)):
+                with open(job.part_path(index), encoding='utf-8') as part:
+                    while True:
+                        lines = list(itertools.islice(part, chunk_size))
+                        if not lines:
+                            break
+                        rows = [_json_loads(line) for line in lines]
+                        columns = {}
+                        for f in fields:
+                            flat_type = PARQUET_TYPES.get(field_types.get(f))
+                            values = [_export_value(row.get(f), field_types.get(f), True) for row in rows]
+                            if flat_type is None:
+                                values = [None if v is None else str(v) for v in values]
+                            columns[f] = values
+                        writer.write_table(pyarrow.table(columns, schema=schema))
+    else:
+        with open(tmp_path, 'wb') as out:
+            if export_format == 'csv':
+                out.write((",".join(fields) + "\r\n").encode('utf-8'))
+            for index in range(len(job.slices)):
+                with open(job.part_path(index), 'rb') as part:
+                    while True:
+                        block = part.read(1024 * 1024)
+                        if not block:
+                            break
+                        out.write(block)
+    if not overwrite and os.path.exists(job.path):
+        os.remove(tmp_path)
+        raise FileExistsError(f"{job.path} already exists, pass overwrite=True to replace it")
+    os.replace(tmp_path, job.path)
+
+
+@mcp.tool()
+@_in_thread
+def export_model(ctx: Context, model: str, path: str = None, format: str = "jsonl", domain: List = None,
+                 fields: List[str] = None, include_binary: bool = False, workers: int = 4,
+                 chunk_size: int = 2000, resume: bool = True, overwrite: bool = False,
+                 target: str = None) -> str:
+    """
+    Export all records of a model matching a domain to a local file (CSV, JSONL or Parquet)
+    
+    Use this instead of search_records when the full dataset is needed: records are
+    streamed to disk in chunks by parallel workers and only a summary is returned.
+    
+    Args:
+        model: Odoo model name (e.g., 'sale.order.line')
+        path: Output file, relative to ODOO_EXPORT_DIR (default: ./exports). Paths outside
+              that directory are rejected. Default: <model>.<format>
+        format: 'jsonl' (default), 'csv' or 'parquet' (requires pyarrow)
+        domain: Domain filter as a list of triplets
+        fields: Fields to export. Default: all stored fields except binary ones
+        include_binary: Also export binary fields when fields is not given (default: False)
+        workers: Number of parallel workers, each exporting one slice of the id range (default: 4,
+                 capped by ODOO_MODEL_CONCURRENCY)
+        chunk_size: Records fetched per request (default: 2000)
+        resume: Continue an interrupted export of the same model/domain/fields/format (default: True)
+        overwrite: Replace the output file when it already exists (default: False)
+        target: Name of the Odoo target (database) to export from
+    
+    Examples:
+        export_model(model="sale.order.line", format="csv", domain=[["state", "=", "sale"]])
+        export_model(model="account.move.line", format="parquet", fields=["date", "account_id", "debit", "credit"])
+    
+    Returns:
+        Summary with row count, file size and throughput
+    """
+    try:
+        if format not in EXPORT_FORMATS:
+            return f"Error: format must be one of {', '.join(EXPORT_FORMATS)}"
+        if format == 'parquet' and not PARQUET_AVAILABLE:
+            return "Error: Parquet export membutuhkan pyarrow. Install dengan 'pip install pyarrow'"
+        if chunk_size < 1 or workers < 1:
+            # limit=0 berarti tanpa batas di Odoo, export tidak akan pernah selesai
+            return "Error: chunk_size and workers must be at least 1"
+        
+        odoo = ctx.request_context.lifespan_context.get(target)
+        try:
+            path = _export_path(path or f"{model}.{format}")
+        except ValueError as e:
+            return f"Error: {str(e)}"
+        if os.path.exists(path) and not overwrite:
+            return f"Error: {path} already exists. Pass overwrite=True to replace it or choose another path"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        fields_info = odoo.fields_get(model)
+        if not fields:
+            fields = [f for f, info in fields_info.items()
+                      if info.get('store', True) and (include_binary or info.get('type') != 'binary')]
+        if 'id' not in fields:
+            fields = ['id'] + fields
+        validate_fields(odoo, model, fields)
+        field_types = {f: fields_info.get(f, {}).get('type', 'integer' if f == 'id' else 'char') for f in fields}
+        compiled = compile_domain(odoo, model, domain)
+        
+        started = time.perf_counter()
+        job = _ExportJob(path, {'model': model, 'domain': compiled.domain, 'fields': fields,
+                                'format': format, 'target': odoo.name})
+        if not (resume and job.load()):
+            first = [] if compiled.unsatisfiable else odoo.execute(
+                model, 'search', compiled.domain, limit=1, order='id asc')
+            last = [] if not first else odoo.execute(model, 'search', compiled.domain, limit=1, order='id desc')
+            if first:
+                job.plan(first[0], last[0], max(1, min(workers, odoo.scheduler.model_concurrency)))
+            else:
+                job.slices = []
+                job.save()
+        else:
+            ctx.info(f"Resuming export of {model} from {job.state_path}")
+        
+        rows_before = sum(item['rows'] for item in job.slices)
+        pending = [i for i, item in enumerate(job.slices) if not item['done']]
+        ctx.info(f"Exporting {model} to {path}: {len(job.slices)} slices, {len(pending)} pending")
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(len(pending), odoo.scheduler.model_concurrency)) as executor:
+                futures = [executor.submit(_export_slice, odoo, job, i, compiled.domain, fields,
+                                           field_types, format, chunk_size, ctx.info) for i in pending]
+                for future in futures:
+                    future.result()
+        
+        _assemble_export(job, fields, field_types, format, chunk_size, overwrite)
+        total_rows = sum(item['rows'] for item in job.slices)
+        job.cleanup()
+        
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        size = os.path.getsize(path)
+        exported_now = total_rows - rows_before
+        result = f"# Export of {model}\n\n"
+        result += f"- File: {path}\n"
+        result += f"- Format: {format}\n"
+        result += f"- Rows: {total_rows}"
+        if job.resumed:
+            result += f" ({rows_before} from the interrupted run, {exported_now} now)"
+        result += "\n"
+        result += f"- Fields: {len(fields)}\n"
+        result += f"- Size: {size / 1048576:.2f} MB ({size} bytes)\n"
+        result += f"- Duration: {elapsed:.1f} s\n"
+        result += f"- Throughput: {exported_now / elapsed:.0f} rows/s, {size / 1048576 / elapsed:.2f} MB/s\n"
+        return result
+    except Exception as e:
+        error_message = f"Error in export_model: {str(e)}"
+        ctx.error(error_message)
+        return error_message
+
+# Odoo mengisi write_date dengan waktu mulai transaksi, jadi record yang di-commit
+# belakangan bisa punya write_date lebih lama dari cursor. Perubahan yang lebih baru
+# dari jeda ini ditahan sampai poll berikutnya (env: ODOO_CHANGES_LAG, detik)
+CHANGES_SAFETY_LAG = _env_float('ODOO_CHANGES_LAG', 60.0)
+
+
+def _encode_change_token(model: str, write_date: str, record_id: int) -> str:
+    payload = json.dumps({'m': model, 'w': write_date, 'i': record_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_change_token(model: str, token: str):
+    """Return (write_date, id) from a get_changes cursor, raises DomainError when invalid"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        write_date, record_id = data['w'], int(data['i'])
+    except Exception:
+        raise DomainError(f"Invalid since_token {token!r}")
+    if data.get('m') != model:
+        raise DomainError(f"since_token belongs to model {data.get('m')}, not {model}")
+    return write_date, record_id
+
+
+@mcp.tool()
+@_in_thread
+def get_changes(ctx: Context, model: str, since_token: str = None, fields: List[str] = None,
+                domain: List = None, limit: int = 500, check_deleted_ids: List[int] = None,
+                from_now: bool = False, target: str = None) -> str:
+    """
+    Return only records created or modified since a cursor (change feed based on write_date)
+    
+    Call repeatedly with the next_token of the previous call to poll for changes; the
+    cost is proportional to the number of changes, not to the size of the table.
+    Changes younger than ODOO_CHANGES_LAG seconds (default 60) are returned by a later
+    call, so records from transactions still committing are not skipped.
+    
+    Args:
+        model: Odoo model name (e.g., 'sale.order', 'stock.quant')
+        since_token: Opaque cursor returned by the previous call. Omit to start from the oldest record
+        fields: Fields to return besides id, write_date and create_date (default: ['display_name'])
+        domain: Optional extra filter, e.g. [["state", "=", "sale"]]
+        limit: Maximum number of changes per page (default: 500). Use has_more/next_token to page
+        check_deleted_ids: Previously seen ids to check for deletion (returns the ids that no longer exist)
+        from_now: Return no records, only a token at the current head of the feed, to start monitoring now
+        target: Name of the Odoo target (database) to query
+    
+    Examples:
+        get_changes(model="sale.order", from_now=True)
+        get_changes(model="sale.order", since_token="eyJtIjoi...", fields=["name", "state", "amount_total"])
+        get_changes(model="stock.quant", since_token="eyJtIjoi...", check_deleted_ids=[12, 15, 18])
+    
+    Returns:
+        Changed records in write_date order, the next_token, and deleted ids if requested
+    """
+    try:
+        ctx.info(f"Getting changes for {model} since {since_token}")
+        if limit <= 0:
+            return "Error: limit must be a positive number"
+        odoo = ctx.request_context.lifespan_context.get(target)
+        
+        fields_info = odoo.fields_get(model)
+        if 'write_date' not in fields_info:
+            return f"Error: {model} has no write_date field, changes cannot be tracked"
+        fields = [f for f in (fields or ['display_name']) if f not in ('id', 'write_date', 'create_date')]
+        validate_fields(odoo, model, fields)
+        compiled = compile_domain(odoo, model, domain)
+        read_fields = fields + ['write_date', 'create_date']
+        
+        since = _decode_change_token(model, since_token) if since_token else None
+        # write_date disimpan dalam UTC
+        cutoff = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() - CHANGES_SAFETY_LAG))
+        
+        if from_now:
+            # Posisikan di cutoff, bukan di record terbaru, agar transaksi yang belum commit tidak terlewat
+            token = _encode_change_token(model, cutoff, 0)
+            return (f"# Changes for {model}\n\nFeed positioned at the current head "
+                    f"(minus the {CHANGES_SAFETY_LAG:g} s safety lag).\n\n"
+                    f"next_token: `{token}`\n")
+        
+        # write_date hanya presisi detik: id dipakai sebagai tiebreak untuk timestamp yang sama
+        change_domain = list(compiled.domain) + [['write_date', '<=', cutoff]]
+        if since:
+            write_date, record_id = since
+            change_domain += [
+                '|', ['write_date', '>', write_date],
+                '&', ['write_date', '=', write_date], ['id', '>', record_id],
+            ]
+        records = [] if compiled.unsatisfiable else odoo.execute(
+            model, 'search_read', change_domain, read_fields, limit=limit + 1, order='write_date asc, id asc')
+        has_more = len(records) > limit
+        records = records[:limit]
+        
+        if records:
+            next_token = _encode_change_token(model, records[-1]['write_date'], records[-1]['id'])
+        else:
+            next_token = since_token or ''
+        
+        result = f"# Changes for {model}\n\n"
+        result += f"{len(records)} changed record(s){' (more available)' if has_more else ''}.\n\n"
+        result += f"next_token: `{next_token}`\n"
+        result += f"has_more: {has_more}\n"
+        result += f"Changes after {cutoff} UTC are returned by a later call.\n\n"
+        
+        if records:
+            for record in records:
+                created = record.get('create_date') or ''
+                if since is None or created > since[0] or (created == since[0] and record['id'] > since[1]):
+                    record['change'] = 'created'
+                else:
+                    record['change'] = 'modified'
+            result += _markdown_table(records, ['id', 'change'] + fields + ['write_date'])
+        
+        if check_deleted_ids:
+            existing = odoo.execute(model, 'search', [['id', 'in', list(check_deleted_ids)]],
+                                    context={'active_test': False})
+            deleted = sorted(set(check_deleted_ids) - set(existing))
+            result += f"\n## Deleted\n\n{len(deleted)} of {len(check_deleted_ids)} checked ids no longer exist"
+            result += f": {deleted}\n" if deleted else ".\n"
+        
+        return result
+    except Exception as e:
+        error_message = f"Error in get_changes: {str(e)}"
+        ctx.error(error_message)
+        return error_message
+
+# Teks dokumen diindeks dengan checksum, jadi aman disimpan lama
+DOCUMENT_TEXT_TTL = _env_float('ODOO_DOCUMENT_CACHE_TTL', 7 * 24 * 3600.0)
+
 @mcp.tool()
+@_in_thread
 def read_document(ctx: Context, document_id: int = None, document_name: str = None, 
-                folder_id: int = None, limit_chars: int = None) -> str:
+                folder_id: int = None, limit_chars: int = None, target: str = None) -> str:
     """
     Membaca isi dokumen PDF/DOCX dari modul 'documents.document' Odoo.
     Jangan batasi jumlah teks yang diekstrak!
@@ -729,6 +3064,7 @@ def read_document(ctx: Context, document_id: int = None, document_name: str = No
         document_id: ID dokumen yang akan dibaca (opsional jika document_name diisi)
         document_name: Nama dokumen untuk dicari (opsional jika document_id diisi)
         folder_id: ID folder untuk membatasi pencarian (opsional)
+        target: Nama target Odoo (database) yang digunakan (opsional)
     
     Examples:
         read_document(document_id=123)
@@ -752,7 +3088,7 @@ def read_document(ctx: Context, document_id: int = None, document_name: str = No
         
         request_params['limit_chars'] = None
         ctx.info(f"Reading document content. ID: {document_id}, Name: {document_name}, Folder: {folder_id}")
-        odoo = ctx.request_context.lifespan_context
+        odoo = ctx.request_context.lifespan_context.get(target)
         
         # Langkah 1: Temukan dokumen berdasarkan parameter
         domain = []
@@ -771,7 +3107,7 @@ def read_document(ctx: Context, document_id: int = None, document_name: str = No
             domain = ['&'] * (len(domain) - 1) + domain
         
         document = odoo.execute('documents.document', 'search_read', domain, 
-                               ['name', 'mimetype', 'datas', 'attachment_id'], 0, 1)
+                               ['name', 'mimetype', 'attachment_id'], 0, 1)
         
         if not document:
             return f"Dokumen tidak ditemukan dengan kriteria: ID={document_id}, Name={document_name}, Folder={folder_id}"
@@ -783,51 +3119,64 @@ def read_document(ctx: Context, document_id: int = None, document_name: str = No
         if not attachment_id or not isinstance(attachment_id, (list, tuple)) or len(attachment_id) != 2:
             return f"Dokumen ditemukan tetapi tidak memiliki attachment: {document['name']}"
         
-        attachment_data = odoo.execute('ir.attachment', 'read', [attachment_id[0]], ['datas'])
-        
-        if not attachment_data or not attachment_data[0].get('datas'):
-            return f"Attachment ditemukan tetapi tidak ada data binary: {document['name']}"
-        
-        # Langkah 3: Dekode binary data
-        try:
-            binary_data = base64.b64decode(attachment_data[0]['datas'])
-        except Exception as e:
-            return f"Error decoding binary data: {str(e)}"
-        
-        # Langkah 4: Parse content berdasarkan mimetype
+        # Teks hasil ekstraksi di-cache per checksum attachment, jadi dokumen yang sama
+        # tidak diunduh dan di-parse ulang (cache dibagi antar worker pada mode HTTP)
         mimetype = document.get('mimetype', '')
-        extracted_text = ""
+        attachment_meta = odoo.execute('ir.attachment', 'read', [attachment_id[0]], ['checksum'])
+        checksum = attachment_meta[0].get('checksum') if attachment_meta else False
+        cache_key = f"{attachment_id[0]}:{checksum}"
+        extracted_text = odoo.store.get(odoo.cache_namespace('doctext'), cache_key) if checksum else None
         
-        try:
-            if 'pdf' in mimetype.lower():
-                # Proses PDF menggunakan PdfReader dari definisi di atas file
-                if PdfReader is None:
-                    return "Error: PDF reader library tidak tersedia. Install pypdf dengan 'pip install pypdf'"
-    
-                pdf_file = BytesIO(binary_data)
-                pdf_reader = PdfReader(pdf_file)
-                
-                # Extract text from each page
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    extracted_text += page.extract_text() + "\n\n"
+        if extracted_text is None:
+            attachment_data = odoo.execute('ir.attachment', 'read', [attachment_id[0]], ['datas'])
+            
+            if not attachment_data or not attachment_data[0].get('datas'):
+                return f"Attachment ditemukan tetapi tidak ada data binary: {document['name']}"
+            
+            # Langkah 3: Dekode binary data
+            try:
+                binary_data = base64.b64decode(attachment_data[0]['datas'])
+            except Exception as e:
+                return f"Error decoding binary data: {str(e)}"
+            
+            # Langkah 4: Parse content berdasarkan mimetype
+            extracted_text = ""
             
-            elif 'word' in mimetype.lower() or 'docx' in mimetype.lower():
-                # Proses DOCX
-                if not DOCX_AVAILABLE:
-                    return f"Library python-docx tidak tersedia. Silakan install dengan 'pip install python-docx'"
+            try:
+                if 'pdf' in mimetype.lower():
+                    # Proses PDF menggunakan PdfReader dari definisi di atas file
+                    if PdfReader is None:
+                        return "Error: PDF reader library tidak tersedia. Install pypdf dengan 'pip install pypdf'"
+                    
+                    pdf_file = BytesIO(binary_data)
+                    pdf_reader = PdfReader(pdf_file)
+                    
+                    # Extract text from each page
+                    for page_num in range(len(pdf_reader.pages)):
+                        page = pdf_reader.pages[page_num]
+                        extracted_text += page.extract_text() + "\n\n"
                 
-                docx_file = BytesIO(binary_data)
-                doc = docx.Document(docx_file)
+                elif 'word' in mimetype.lower() or 'docx' in mimetype.lower():
+                    # Proses DOCX
+                    if not DOCX_AVAILABLE:
+                        return f"Library python-docx tidak tersedia. Silakan install dengan 'pip install python-docx'"
+                    
+                    docx_file = BytesIO(binary_data)
+                    doc = docx.Document(docx_file)
+                    
+                    # Extract text from paragraphs
+                    extracted_text = "\n\n".join([para.text for para in doc.paragraphs if para.text])
                 
-                # Extract text from paragraphs
-                extracted_text = "\n\n".join([para.text for para in doc.paragraphs if para.text])
+                else:
+                    return f"Tipe dokumen tidak didukung: {mimetype}"
             
-            else:
-                return f"Tipe dokumen tidak didukung: {mimetype}"
-        
-        except Exception as e:
-            return f"Error parsing document content: {str(e)}"
+            except Exception as e:
+                return f"Error parsing document content: {str(e)}"
+            
+            if checksum:
+                odoo.store.set(odoo.cache_namespace('doctext'), cache_key, extracted_text, DOCUMENT_TEXT_TTL)
+        else:
+            ctx.info(f"Using cached text for attachment {attachment_id[0]}")
         
         # Langkah 5: Format hasil
         if not extracted_text.strip():
@@ -926,6 +3275,127 @@ def query_with_metadata(search_terms: str) -> str:
 2. Berdasarkan metadata tersebut, buatlah query yang tepat menggunakan advanced_query
 3. Analisis hasilnya dan berikan insight"""
 
+HTTP_TRANSPORTS = ('sse', 'streamable-http')
+
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+
+class BearerTokenMiddleware:
+    """Reject HTTP requests without `Authorization: Bearer <ODOO_MCP_TOKEN>`"""
+
+    def __init__(self, app, token: str):
+        self.app = app
+        self.expected = f"Bearer {token}".encode('utf-8')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            provided = dict(scope.get('headers') or []).get(b'authorization', b'')
+            if not hmac.compare_digest(provided, self.expected):
+                await send({'type': 'http.response.start', 'status': 401,
+                            'headers': [(b'content-type', b'text/plain'), (b'www-authenticate', b'Bearer')]})
+                await send({'type': 'http.response.body', 'body': b'Unauthorized'})
+                return
+        await self.app(scope, receive, send)
+
+
+def _transport_security(host: str) -> Optional[TransportSecuritySettings]:
+    """
+    DNS-rebinding protection for the address the HTTP server is bound to
+
+    FastMCP only accepts localhost Host headers by default. When bound to another
+    address, the Host/Origin values in ODOO_MCP_ALLOWED_HOSTS (e.g. "10.0.0.5:*,
+    mcp.example.com:8000") are accepted; without that list the check is turned off,
+    since main() only serves beyond localhost with ODOO_MCP_TOKEN required.
+    """
+    if host in LOOPBACK_HOSTS:
+        return mcp.settings.transport_security
+    allowed = [item.strip() for item in os.environ.get('ODOO_MCP_ALLOWED_HOSTS', '').split(',') if item.strip()]
+    if not allowed:
+        return TransportSecuritySettings(enable_dns_rebinding_protection=False)
+    allowed += ['127.0.0.1:*', 'localhost:*', '[::1]:*']
+    return TransportSecuritySettings(
+        enable_dns_rebinding_protection=True,
+        allowed_hosts=allowed,
+        allowed_origins=[f"{scheme}://{item}" for item in allowed for scheme in ('http', 'https')],
+    )
+
+
+def create_http_app():
+    """ASGI app factory used by uvicorn worker processes (see --workers)"""
+    global _keep_registry
+    _keep_registry = True
+    mcp.settings.transport_security = _transport_security(os.environ.get('ODOO_MCP_HOST', '127.0.0.1'))
+    if os.environ.get('ODOO_MCP_TRANSPORT') == 'sse':
+        app = mcp.sse_app()
+    else:
+        if _env_int('ODOO_MCP_WORKERS', 1) > 1:
+            # Request berikutnya dari klien yang sama bisa masuk ke worker lain
+            mcp.settings.stateless_http = True
+        app = mcp.streamable_http_app()
+    
+    # Registry hidup selama proses worker, jadi ditutup saat aplikasi berhenti
+    app_lifespan = app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        async with app_lifespan(app) as state:
+            try:
+                yield state
+            finally:
+                _close_registry()
+    
+    app.router.lifespan_context = lifespan
+    token = os.environ.get('ODOO_MCP_TOKEN')
+    if token:
+        app.add_middleware(BearerTokenMiddleware, token=token)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Odoo MCP server")
+    parser.add_argument('--transport', choices=('stdio',) + HTTP_TRANSPORTS,
+                        default=os.environ.get('ODOO_MCP_TRANSPORT', 'stdio'),
+                        help="stdio (Claude Desktop), sse or streamable-http (default: stdio)")
+    parser.add_argument('--host', default=os.environ.get('ODOO_MCP_HOST', '127.0.0.1'))
+    parser.add_argument('--port', type=int, default=_env_int('ODOO_MCP_PORT', 8000))
+    parser.add_argument('--workers', type=int, default=_env_int('ODOO_MCP_WORKERS', 1),
+                        help="Worker processes for streamable-http (default: 1)")
+    args = parser.parse_args()
+    
+    if args.transport == 'stdio':
+        mcp.run()
+        return
+    if args.host not in LOOPBACK_HOSTS and not os.environ.get('ODOO_MCP_TOKEN'):
+        # Tanpa token siapa pun di jaringan bisa membaca ERP dengan akun service
+        parser.error(f"--host {args.host} exposes Odoo to the network; set ODOO_MCP_TOKEN "
+                     f"or keep the default 127.0.0.1 behind an authenticating reverse proxy")
+    
+    workers = args.workers
+    if args.transport == 'sse' and workers > 1:
+        # Stream SSE dan POST pesan harus ditangani proses yang sama
+        print("SSE sessions are bound to one process, use --transport streamable-http for several workers")
+        workers = 1
+    if workers > 1 and not os.environ.get('ODOO_MCP_CACHE_DB'):
+        os.makedirs(_data_dir(), mode=0o700, exist_ok=True)
+        os.environ['ODOO_MCP_CACHE_DB'] = _data_dir('cache.sqlite3')
+    # Worker processes read their settings from the environment
+    os.environ['ODOO_MCP_TRANSPORT'] = args.transport
+    os.environ['ODOO_MCP_HOST'] = args.host
+    os.environ['ODOO_MCP_WORKERS'] = str(workers)
+    
+    import uvicorn
+    print(f"Serving Odoo MCP over {args.transport} on http://{args.host}:{args.port} "
+          f"with {workers} worker(s), shared cache: {os.environ.get('ODOO_MCP_CACHE_DB', 'none')}, "
+          f"token auth: {'on' if os.environ.get('ODOO_MCP_TOKEN') else 'off'}")
+    if workers > 1:
+        # Scheduler, pool dan circuit breaker tidak dibagi antar proses
+        print(f"Connection pools, admission limits and circuit breakers are per worker: "
+              f"up to {workers} x ODOO_POOL_SIZE concurrent calls reach each Odoo target")
+        uvicorn.run("odoo_mcp_server:create_http_app", factory=True, host=args.host,
+                    port=args.port, workers=workers)
+    else:
+        uvicorn.run(create_http_app(), host=args.host, port=args.port)
+
 # Run the server
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    main()
\ No newline at end of file
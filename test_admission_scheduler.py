@@ -0,0 +1,70 @@
+"""
+Tests for the admission scheduler lanes (AdmissionScheduler)
+
+Run with: python -m pytest -q test_admission_scheduler.py
+"""
+import threading
+import time
+
+import pytest
+
+from odoo_mcp_server import AdmissionScheduler, OdooOverloadedError
+
+
+def hold(scheduler, model, lane, release, admitted=None, errors=None):
+    """Occupy a slot in a thread until `release` is set"""
+    def run():
+        try:
+            with scheduler.admit(model, lane):
+                if admitted is not None:
+                    admitted.set()
+                release.wait(5)
+        except OdooOverloadedError as e:
+            if errors is not None:
+                errors.append(e)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_heavy_call_not_blocked_by_light_waiter_at_its_model_limit():
+    scheduler = AdmissionScheduler(max_concurrency=4, heavy_concurrency=2, model_concurrency=2,
+                                   queue_timeout=2.0)
+    release = threading.Event()
+    threads = [hold(scheduler, 'model.a', 'light', release) for _ in range(2)]
+    wait_for(lambda: scheduler.snapshot()['running']['light'] == 2)
+    threads.append(hold(scheduler, 'model.a', 'light', release))
+    wait_for(lambda: scheduler.snapshot()['waiting']['light'] == 1)
+
+    started = time.monotonic()
+    with scheduler.admit('model.b', 'heavy'):
+        assert time.monotonic() - started < 0.5
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert scheduler.shed == 0
+
+
+def test_queue_full_is_shed_immediately():
+    scheduler = AdmissionScheduler(max_concurrency=2, model_concurrency=1, max_queue=1, queue_timeout=2.0)
+    release = threading.Event()
+    threads = [hold(scheduler, 'model.a', 'light', release)]
+    wait_for(lambda: scheduler.snapshot()['running']['light'] == 1)
+    threads.append(hold(scheduler, 'model.a', 'light', release))
+    wait_for(lambda: scheduler.snapshot()['waiting']['light'] == 1)
+
+    started = time.monotonic()
+    with pytest.raises(OdooOverloadedError, match="queue full"):
+        with scheduler.admit('model.a', 'light'):
+            pass
+    assert time.monotonic() - started < 0.5
+    release.set()
+    for thread in threads:
+        thread.join(5)
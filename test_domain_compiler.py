@@ -0,0 +1,89 @@
+"""
+Tests for the local domain compiler (compile_domain) against a fake schema
+
+Run with: python -m pytest -q test_domain_compiler.py
+"""
+import pytest
+
+from odoo_mcp_server import DomainError, compile_domain
+
+FIELDS = {
+    'sale.order': {
+        'name': {'type': 'char'},
+        'state': {'type': 'selection'},
+        'sequence': {'type': 'integer'},
+        'date_order': {'type': 'datetime'},
+        'amount_total': {'type': 'monetary'},
+        'partner_id': {'type': 'many2one', 'relation': 'res.partner'},
+        'tag_ids': {'type': 'many2many', 'relation': 'crm.tag'},
+        'order_line': {'type': 'one2many', 'relation': 'sale.order.line'},
+    },
+    'sale.order.line': {
+        'product_id': {'type': 'many2one', 'relation': 'product.product'},
+        'order_id': {'type': 'many2one', 'relation': 'sale.order'},
+    },
+    'res.partner': {
+        'name': {'type': 'char'},
+        'country_id': {'type': 'many2one', 'relation': 'res.country'},
+    },
+    'res.country': {'code': {'type': 'char'}},
+    'crm.tag': {'name': {'type': 'char'}},
+    'product.product': {'name': {'type': 'char'}},
+}
+
+
+class FakeSchema:
+    def fields_get(self, model):
+        return FIELDS[model]
+
+
+def compile(domain, model='sale.order'):
+    return compile_domain(FakeSchema(), model, domain)
+
+
+@pytest.mark.parametrize('domain', [
+    [['tag_ids', '=', 1], ['tag_ids', '=', 2]],
+    [['order_line.product_id', '=', 1], ['order_line.product_id', '=', 2]],
+    [['partner_id', '=', 5], ['partner_id', '=', 'Azure']],
+    [['partner_id', 'in', [5]], ['partner_id', '=', 'Azure']],
+])
+def test_multi_valued_leaves_are_not_contradictions(domain):
+    compiled = compile(domain)
+    assert not compiled.unsatisfiable
+    assert compiled.domain == domain
+
+
+@pytest.mark.parametrize('domain', [
+    [['state', '=', 'draft'], ['state', '=', 'sale']],
+    [['partner_id', '=', 5], ['partner_id', '=', 6]],
+    [['partner_id', 'in', [5, 6]], ['partner_id', '=', 7]],
+    [['partner_id.country_id.code', '=', 'ID'], ['partner_id.country_id.code', '=', 'FR']],
+    [['state', '=', 'draft'], ['state', '!=', 'draft']],
+    [['sequence', '=', 5], ['sequence', '=', 6]],
+    [['name', 'in', ['S01', 'S02']], ['name', '=', 'S03']],
+])
+def test_single_valued_contradictions(domain):
+    assert compile(domain).unsatisfiable
+
+
+@pytest.mark.parametrize('domain', [
+    [['date_order', '=', '2025-01-01'], ['date_order', '=', '2025-01-01 00:00:00']],
+    [['amount_total', '=', 5], ['amount_total', '=', '5']],
+    [['amount_total', '=', 5], ['amount_total', '=', 5.5]],
+    [['sequence', '=', 5], ['sequence', '=', '5']],
+    [['sequence', 'in', [5, '6']], ['sequence', '=', 7]],
+])
+def test_values_converted_by_odoo_are_not_contradictions(domain):
+    compiled = compile(domain)
+    assert not compiled.unsatisfiable
+    assert compiled.domain == domain
+
+
+def test_normalizes_operators_and_duplicates():
+    compiled = compile([['state', '==', 'draft'], ['state', '=', 'draft'], ['name', 'ILIKE', 'S0']])
+    assert compiled.domain == [['state', '=', 'draft'], ['name', 'ilike', 'S0']]
+
+
+def test_unknown_field_suggests_close_match():
+    with pytest.raises(DomainError, match="Did you mean: state"):
+        compile([['stat', '=', 'draft']])
@@ -0,0 +1,57 @@
+"""
+Tests for the HTTP app returned by create_http_app (token auth, Host header checks)
+
+Run with: python -m pytest -q test_http_app.py
+"""
+import pytest
+from starlette.testclient import TestClient
+
+import odoo_mcp_server
+
+INITIALIZE = {
+    'jsonrpc': '2.0', 'id': 1, 'method': 'initialize',
+    'params': {'protocolVersion': '2025-03-26', 'capabilities': {},
+               'clientInfo': {'name': 'test', 'version': '1'}},
+}
+HEADERS = {'Accept': 'application/json, text/event-stream', 'Content-Type': 'application/json'}
+
+
+@pytest.fixture
+def http_app(monkeypatch):
+    """Build a fresh app for the given environment; Odoo is never reached by initialize"""
+    monkeypatch.setenv('ODOO_MCP_TRANSPORT', 'streamable-http')
+    monkeypatch.setenv('ODOO_MCP_WORKERS', '1')
+    monkeypatch.setenv('ODOO_SNAPSHOT_DIR', '')
+    monkeypatch.setenv('ODOO_URL', 'http://127.0.0.1:9')
+    monkeypatch.setattr(odoo_mcp_server.mcp.settings, 'transport_security',
+                        odoo_mcp_server.mcp.settings.transport_security)
+    monkeypatch.setattr(odoo_mcp_server.mcp, '_session_manager', None)
+
+    def build(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return TestClient(odoo_mcp_server.create_http_app(), base_url='http://10.0.0.5:8000')
+    yield build
+    odoo_mcp_server._close_registry()
+
+
+def test_network_host_accepts_any_host_header_with_token(http_app):
+    with http_app(ODOO_MCP_HOST='0.0.0.0', ODOO_MCP_TOKEN='s3cret') as client:
+        response = client.post('/mcp', json=INITIALIZE,
+                               headers={**HEADERS, 'Authorization': 'Bearer s3cret'})
+        assert response.status_code == 200
+        assert client.post('/mcp', json=INITIALIZE, headers=HEADERS).status_code == 401
+
+
+def test_allowed_hosts_are_enforced(http_app):
+    with http_app(ODOO_MCP_HOST='0.0.0.0', ODOO_MCP_TOKEN='s3cret',
+                  ODOO_MCP_ALLOWED_HOSTS='10.0.0.5:*') as client:
+        headers = {**HEADERS, 'Authorization': 'Bearer s3cret'}
+        assert client.post('/mcp', json=INITIALIZE, headers=headers).status_code == 200
+        response = client.post('/mcp', json=INITIALIZE, headers={**headers, 'Host': 'evil.example:8000'})
+        assert response.status_code == 421
+
+
+def test_localhost_keeps_default_protection(http_app):
+    with http_app(ODOO_MCP_HOST='127.0.0.1') as client:
+        assert client.post('/mcp', json=INITIALIZE, headers=HEADERS).status_code == 421